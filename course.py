@@ -14,27 +14,58 @@ class Course:
     :type course_name: str
     :param instructor: The instructor for the course, defaults to None.
     :type instructor: Instructor, optional
-    :param enrolled_students: A list of students enrolled in the course, defaults to None.
+    :param enrolled_students: The students enrolled in the course, defaults to None.
+        They are stored in a dict keyed by student ID.
     :type enrolled_students: list[Student], optional
     """
+    __slots__ = ("_course_id", "_course_name", "instructor", "enrolled_students", "_display")
+
     def __init__(self, course_id: str, course_name: str, instructor: Instructor = None, enrolled_students = None):
+        self._display = None
         self.course_id = course_id
         self.course_name = course_name
         self.instructor = None
-        if enrolled_students is None:
-            self.enrolled_students = []
-        else:
-            self.enrolled_students = enrolled_students
+        self.enrolled_students = {}
+        for student in enrolled_students or []:
+            self.enrolled_students.setdefault(student.student_id, student)
         
+    @property
+    def course_id(self):
+        """
+        The course's unique identifier. Setting it clears the cached display string.
+
+        :rtype: str
+        """
+        return self._course_id
+
+    @course_id.setter
+    def course_id(self, value):
+        self._course_id = value
+        self._display = None
+
+    @property
+    def course_name(self):
+        """
+        The course's name. Setting it clears the cached display string.
+
+        :rtype: str
+        """
+        return self._course_name
+
+    @course_name.setter
+    def course_name(self, value):
+        self._course_name = value
+        self._display = None
+
     def add_instructor(self, instructor):
         """
         Assigns an instructor to the course.
 
         :param instructor: The instructor to assign.
         :type instructor: Instructor
-        :raises ValueError: If the provided object is not an instance of Instructor.
+        :raises ValueError: If the provided object has no instructor ID.
         """
-        if not isinstance(instructor, Instructor):
+        if not hasattr(instructor, "instructor_id"):
             raise ValueError("Only an Instructor can be assigned to the course.")
         self.instructor = instructor
 
@@ -46,12 +77,11 @@ class Course:
 
         :param student: The student to enroll.
         :type student: Student
-        :raises ValueError: If the provided object is not an instance of Student.
+        :raises ValueError: If the provided object has no student ID.
         """
-        if not isinstance(student, Student):
+        if not hasattr(student, "student_id"):
             raise ValueError("Only a Student can be enrolled in the course.")
-        if student not in self.enrolled_students:
-            self.enrolled_students.append(student)
+        self.enrolled_students.setdefault(student.student_id, student)
         
     def to_dict(self):
         """
@@ -64,7 +94,7 @@ class Course:
             'course_id': self.course_id,
             'course_name': self.course_name,
             "instructor": self.instructor.to_dict() if self.instructor is not None else None,
-            'enrolled_students': [student.to_dict() for student in self.enrolled_students] 
+            'enrolled_students': [student.to_dict() for student in self.enrolled_students.values()]
         }
         
     @classmethod
@@ -78,14 +108,18 @@ class Course:
         :rtype: Course
         """
         instructor = Instructor.from_dict(data.get('instructor')) if data.get('instructor') else None
-        students = [Student.from_dict(student_data) for student_data in data['enrolled_students']]
+        students = [student for student in map(Student.from_dict, data['enrolled_students']) if student is not None]
         return cls(data['course_id'], data['course_name'], instructor, students)
 
     def display_course(self):
         """
         Generates a human-readable string for the course object.
 
+        The string is built once and reused until the ID or name changes.
+
         :return: A formatted string with the course's ID and name.
         :rtype: str
         """
-        return f"{self.course_id} - {self.course_name}"
\ No newline at end of file
+        if self._display is None:
+            self._display = f"{self.course_id} - {self.course_name}"
+        return self._display
\ No newline at end of file
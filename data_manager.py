@@ -1,49 +1,103 @@
 """
 This module provides a DataManager class for handling JSON data storage.
+
+orjson is used for parsing and serialization when it is installed; otherwise
+the standard library json module is used with equivalent output.
 """
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data):
+    """
+    Serializes data to indented UTF-8 JSON bytes.
+
+    :param data: The data to serialize.
+    :type data: any
+    :return: The encoded JSON document.
+    :rtype: bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw):
+    """
+    Parses JSON bytes into Python objects.
+
+    :param raw: The encoded JSON document.
+    :type raw: bytes
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    :return: The decoded data.
+    :rtype: any
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class DataManager:
     """
     A manager for saving and loading data to and from JSON files.
     """
-    
+
     @staticmethod
     def save_data(filename, data, key_field):
         """
         Saves a list of records to a JSON file, updating existing records
-        and adding new ones.
+        and adding new ones. The file is left untouched when no record changes.
 
         :param filename: The path to the JSON file.
         :type filename: str
-        :param data: A list of objects to save. Each object must have a 'to_dict' method.
+        :param data: A list of objects to save. Each object must have a 'to_dict' method
+            or already be a record dict.
         :type data: list
         :param key_field: The name of the unique key field used to identify records.
         :type key_field: str
         """
-        
+
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                existing = json.load(f)
-                if not isinstance(existing, list):
-                    existing = []
+            with open(filename, "rb") as f:
+                existing = _loads(f.read())
+            dirty = not isinstance(existing, list)
+            if dirty:
+                existing = []
         except (FileNotFoundError, json.JSONDecodeError):
             existing = []
+            dirty = True
+
 
-        
         by_key = {str(record[key_field]): record for record in existing if isinstance(record, dict) and key_field in record}
+        # Records dropped while indexing (duplicates, malformed entries) still require a rewrite.
+        dirty = dirty or len(by_key) != len(existing)
 
         for obj in data or []:
             if obj is None:
                 continue
-            record = obj.to_dict()
+            record = obj if isinstance(obj, dict) else obj.to_dict()
             key = str(record.get(key_field))
             if not key:
                 continue
-            by_key[key] = {**by_key.get(key, {}), **record}
+            existing_record = by_key.get(key)
+            if existing_record is None:
+                by_key[key] = record
+                dirty = True
+            elif any(field not in existing_record or existing_record[field] != value
+                     for field, value in record.items()):
+                existing_record.update(record)
+                dirty = True
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(list(by_key.values()), f, indent=4, ensure_ascii=False)
+        # Nothing changed, so skip re-serializing the whole file.
+        if not dirty:
+            return
+
+        with open(filename, "wb") as f:
+            f.write(_dumps(list(by_key.values())))
 
     @staticmethod
     def overwrite_json_file(filename, data):
@@ -55,8 +109,8 @@ class DataManager:
         :param data: The data to write to the file.
         :type data: any
         """
-        with open(filename, 'w') as file:
-            json.dump(data, file, indent=4)
+        with open(filename, 'wb') as file:
+            file.write(_dumps(data))
 
     @staticmethod
     def load_json(filename):
@@ -68,6 +122,6 @@ class DataManager:
         :return: The data loaded from the file.
         :rtype: any
         """
-        
-        with open(filename, 'r') as file:
-            return json.load(file)
+
+        with open(filename, 'rb') as file:
+            return _loads(file.read())
@@ -2,13 +2,119 @@
 This module defines the DatabaseManager class for interacting with the SQLite database.
 """
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 import os
-import shutil
 from student import Student
 from instructor import Instructor
 from course import Course
 
+# SQL is kept in module constants so every call passes the same string and
+# hits sqlite3's per-connection statement cache instead of re-preparing.
+_SQL_CREATE_STUDENT_COURSES = """
+    CREATE TABLE IF NOT EXISTS student_courses (
+        student_id TEXT,
+        course_id TEXT,
+        FOREIGN KEY (student_id) REFERENCES students (student_id) ON DELETE CASCADE,
+        FOREIGN KEY (course_id) REFERENCES courses (course_id) ON DELETE CASCADE,
+        PRIMARY KEY (student_id, course_id)
+    )
+"""
+_SQL_CREATE_INSTRUCTOR_COURSES = """
+    CREATE TABLE IF NOT EXISTS instructor_courses (
+        instructor_id TEXT,
+        course_id TEXT,
+        FOREIGN KEY (instructor_id) REFERENCES instructors (instructor_id) ON DELETE CASCADE,
+        FOREIGN KEY (course_id) REFERENCES courses (course_id) ON DELETE CASCADE,
+        PRIMARY KEY (instructor_id, course_id)
+    )
+"""
+_SQL_CREATE_JOIN_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_student_courses_course ON student_courses (course_id)",
+    "CREATE INDEX IF NOT EXISTS idx_instructor_courses_course ON instructor_courses (course_id)",
+)
+_SQL_INSERT_STUDENT = "INSERT INTO students (student_id, name, age, email) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_INSTRUCTOR = "INSERT INTO instructors (instructor_id, name, age, email) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_COURSE = "INSERT INTO courses (course_id, course_name) VALUES (?, ?)"
+_SQL_INSERT_STUDENT_COURSE = "INSERT INTO student_courses (student_id, course_id) VALUES (?, ?)"
+_SQL_INSERT_INSTRUCTOR_COURSE = "INSERT INTO instructor_courses (instructor_id, course_id) VALUES (?, ?)"
+_SQL_SELECT_STUDENTS = "SELECT student_id, name, age, email FROM students"
+_SQL_SELECT_INSTRUCTORS = "SELECT instructor_id, name, age, email FROM instructors"
+_SQL_SELECT_COURSES = "SELECT course_id, course_name FROM courses"
+_SQL_SELECT_COURSES_WITH_RELATIONS = """
+    SELECT c.course_id, c.course_name,
+           i.instructor_id, i.name, i.age, i.email,
+           s.student_id, s.name, s.age, s.email
+    FROM courses c
+    LEFT JOIN instructor_courses ic ON ic.course_id = c.course_id
+    LEFT JOIN instructors i ON i.instructor_id = ic.instructor_id
+    LEFT JOIN student_courses sc ON sc.course_id = c.course_id
+    LEFT JOIN students s ON s.student_id = sc.student_id
+    ORDER BY c.rowid
+"""
+_SQL_SELECT_ALL_RECORDS = """
+    SELECT 'Student', student_id, name, email FROM students
+    UNION ALL
+    SELECT 'Instructor', instructor_id, name, email FROM instructors
+    UNION ALL
+    SELECT 'Course', course_id, course_name, '-' FROM courses
+"""
+_SQL_DELETE_STUDENT = "DELETE FROM students WHERE student_id = ?"
+_SQL_DELETE_INSTRUCTOR = "DELETE FROM instructors WHERE instructor_id = ?"
+_SQL_DELETE_COURSE = "DELETE FROM courses WHERE course_id = ?"
+
+_SQL_SYNC_STUDENTS = (
+    """
+    INSERT INTO students (student_id, name, age, email)
+    SELECT json_extract(value, '$.student_id'), json_extract(value, '$.name'),
+           json_extract(value, '$.age'), json_extract(value, '$.email')
+    FROM json_each(?) WHERE true
+    ON CONFLICT (student_id) DO UPDATE SET name = excluded.name, age = excluded.age, email = excluded.email
+    """,
+    """
+    INSERT OR IGNORE INTO student_courses (student_id, course_id)
+    SELECT json_extract(s.value, '$.student_id'), c.value
+    FROM json_each(?) AS s, json_each(s.value, '$.registered_courses') AS c
+    WHERE EXISTS (SELECT 1 FROM courses WHERE course_id = c.value)
+    """,
+)
+_SQL_SYNC_INSTRUCTORS = (
+    """
+    INSERT INTO instructors (instructor_id, name, age, email)
+    SELECT json_extract(value, '$.instructor_id'), json_extract(value, '$.name'),
+           json_extract(value, '$.age'), json_extract(value, '$.email')
+    FROM json_each(?) WHERE true
+    ON CONFLICT (instructor_id) DO UPDATE SET name = excluded.name, age = excluded.age, email = excluded.email
+    """,
+    """
+    INSERT OR IGNORE INTO instructor_courses (instructor_id, course_id)
+    SELECT json_extract(i.value, '$.instructor_id'), c.value
+    FROM json_each(?) AS i, json_each(i.value, '$.assigned_courses') AS c
+    WHERE EXISTS (SELECT 1 FROM courses WHERE course_id = c.value)
+    """,
+)
+_SQL_SYNC_COURSES = (
+    """
+    INSERT INTO courses (course_id, course_name)
+    SELECT json_extract(value, '$.course_id'), json_extract(value, '$.course_name')
+    FROM json_each(?) WHERE true
+    ON CONFLICT (course_id) DO UPDATE SET course_name = excluded.course_name
+    """,
+    """
+    INSERT OR IGNORE INTO student_courses (student_id, course_id)
+    SELECT json_extract(s.value, '$.student_id'), json_extract(c.value, '$.course_id')
+    FROM json_each(?) AS c, json_each(c.value, '$.enrolled_students') AS s
+    WHERE EXISTS (SELECT 1 FROM students WHERE student_id = json_extract(s.value, '$.student_id'))
+    """,
+    """
+    INSERT OR IGNORE INTO instructor_courses (instructor_id, course_id)
+    SELECT json_extract(value, '$.instructor.instructor_id'), json_extract(value, '$.course_id')
+    FROM json_each(?)
+    WHERE EXISTS (SELECT 1 FROM instructors WHERE instructor_id = json_extract(value, '$.instructor.instructor_id'))
+    """,
+)
+
 class DatabaseManager:
     """
     Manages all interactions with the school's SQLite database.
@@ -18,68 +124,210 @@ class DatabaseManager:
     """
     def __init__(self, db_name="school.db"):
         self.db_name = db_name
+        # Long-lived connection in autocommit mode so writes can manage their
+        # own BEGIN/COMMIT. The lock serializes access when the UI hands work
+        # to a background thread.
+        self._conn = sqlite3.connect(
+            db_name, isolation_level=None, check_same_thread=False, cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        # Records returned by get_all_*, keyed by table and dropped when the table is written
+        self._cache = {}
+        self._conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=134217728;
+            PRAGMA foreign_keys=ON;
+        ''')
         self.create_tables()
-        
+
+    def close(self):
+        """
+        Closes the shared connection. The manager must not be used afterwards.
+        """
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Runs the enclosed statements inside a single transaction on the shared connection.
+
+        The transaction is rolled back if the block raises, so a write either
+        lands completely or not at all. Every caller writes, so the write lock
+        is taken up front instead of being upgraded from a read lock mid-transaction.
+
+        :return: A context manager yielding the shared connection.
+        :rtype: contextmanager
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _executemany(self, sql, rows):
+        """
+        Executes a statement for every row inside a single transaction.
+
+        :param sql: The parameterized SQL statement to execute.
+        :type sql: str
+        :param rows: A list of parameter tuples.
+        :type rows: list[tuple]
+        """
+        with self._transaction() as conn:
+            conn.executemany(sql, rows)
+
+    def _execute(self, sql, params=()):
+        """
+        Executes a single write statement on the shared connection.
+
+        In autocommit mode a lone statement is its own transaction.
+
+        :param sql: The parameterized SQL statement to execute.
+        :type sql: str
+        :param params: The statement parameters, defaults to an empty tuple.
+        :type params: tuple, optional
+        """
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def _cached(self, table, load):
+        """
+        Returns the cached records of a table, loading them on first use.
+
+        The records themselves are shared between callers, which must not modify them.
+
+        :param table: The table the records come from.
+        :type table: str
+        :param load: Fetches the records when none are cached.
+        :type load: callable
+        :return: A new list of the cached records.
+        :rtype: list
+        """
+        with self._lock:
+            records = self._cache.get(table)
+            if records is None:
+                records = self._cache[table] = tuple(load())
+            return list(records)
+
+    def _invalidate(self, table):
+        """
+        Drops the cached records of a table after it has been written,
+        together with the combined display rows that include them.
+
+        :param table: The table that was written.
+        :type table: str
+        """
+        with self._lock:
+            self._cache.pop(table, None)
+            self._cache.pop("records", None)
+
+    def invalidate_all(self):
+        """
+        Drops every cached record so the next read goes to the database.
+
+        The cache only sees writes made through this manager, so call this
+        before showing data that another process may have changed.
+        """
+        with self._lock:
+            self._cache.clear()
+
+    def _fetchall(self, sql, params=()):
+        """
+        Runs a read query on the shared connection and returns every row.
+
+        :param sql: The SQL query to execute.
+        :type sql: str
+        :param params: The query parameters, defaults to an empty tuple.
+        :type params: tuple, optional
+        :return: The fetched rows.
+        :rtype: list[sqlite3.Row]
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
     def create_tables(self):
         """
         Creates the necessary database tables if they do not already exist.
         This includes tables for students, instructors, courses, and their relationships.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        # Create Students table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS students (
-                student_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                age INTEGER NOT NULL,
-                email TEXT UNIQUE NOT NULL
-            )
-        ''')
-        
-        # Create Instructors table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS instructors (
-                instructor_id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                age INTEGER NOT NULL,
-                email TEXT UNIQUE NOT NULL
-            )
-        ''')
-        
-        # Create Courses table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS courses (
-                course_id TEXT PRIMARY KEY,
-                course_name TEXT NOT NULL
-            )
-        ''')
-        
-        # Create Student Course Registration table (many-to-many relationship)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS student_courses (
-                student_id TEXT,
-                course_id TEXT,
-                FOREIGN KEY (student_id) REFERENCES students (student_id),
-                FOREIGN KEY (course_id) REFERENCES courses (course_id),
-                PRIMARY KEY (student_id, course_id)
-            )
-        ''')
-        
-        # Create Instructor Course Assignment table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS instructor_courses (
-                instructor_id TEXT,
-                course_id TEXT,
-                FOREIGN KEY (instructor_id) REFERENCES instructors (instructor_id),
-                FOREIGN KEY (course_id) REFERENCES courses (course_id),
-                PRIMARY KEY (instructor_id, course_id)
+        with self._transaction() as conn:
+            cursor = conn.cursor()
+
+            # Create Students table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS students (
+                    student_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    age INTEGER NOT NULL,
+                    email TEXT UNIQUE NOT NULL
+                )
+            ''')
+
+            # Create Instructors table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS instructors (
+                    instructor_id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    age INTEGER NOT NULL,
+                    email TEXT UNIQUE NOT NULL
+                )
+            ''')
+
+            # Create Courses table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS courses (
+                    course_id TEXT PRIMARY KEY,
+                    course_name TEXT NOT NULL
+                )
+            ''')
+
+            # Create Student Course Registration table (many-to-many relationship)
+            self._create_join_table(cursor, "student_courses", _SQL_CREATE_STUDENT_COURSES)
+
+            # Create Instructor Course Assignment table
+            self._create_join_table(cursor, "instructor_courses", _SQL_CREATE_INSTRUCTOR_COURSES)
+
+            # The join tables' primary keys lead with the person ID, so lookups and
+            # cascades by course need their own index.
+            for statement in _SQL_CREATE_JOIN_INDEXES:
+                cursor.execute(statement)
+
+    @staticmethod
+    def _create_join_table(cursor, table, ddl):
+        """
+        Creates a join table, rebuilding it first if it predates ON DELETE CASCADE.
+
+        SQLite cannot alter a foreign key in place, so an older table is renamed,
+        recreated from the current DDL, and its rows are copied back. Rows that
+        point at records which no longer exist are dropped during the copy.
+
+        :param cursor: A cursor inside the table-creation transaction.
+        :type cursor: sqlite3.Cursor
+        :param table: The name of the join table.
+        :type table: str
+        :param ddl: The CREATE TABLE statement for the join table.
+        :type ddl: str
+        """
+        foreign_keys = cursor.execute(f"PRAGMA foreign_key_list({table})").fetchall()
+        if foreign_keys and any(fk[6] != "CASCADE" for fk in foreign_keys):
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+            cursor.execute(ddl)
+            parent_checks = " AND ".join(
+                f"EXISTS (SELECT 1 FROM {fk[2]} WHERE {fk[2]}.{fk[4]} = old.{fk[3]})"
+                for fk in foreign_keys
             )
-        ''')
-        
-        conn.commit()
-        conn.close()
+            cursor.execute(f"INSERT INTO {table} SELECT * FROM {table}_old AS old WHERE {parent_checks}")
+            cursor.execute(f"DROP TABLE {table}_old")
+        else:
+            cursor.execute(ddl)
 
     def add_student(self, student):
         """
@@ -89,47 +337,47 @@ class DatabaseManager:
         :type student: Student
         :raises ValueError: If the student already exists or the email is in use.
         """
-        
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        self.add_students_bulk([student])
+
+    def add_students_bulk(self, students):
+        """
+        Adds several students to the database in a single transaction.
+
+        :param students: The student objects to add.
+        :type students: list[Student]
+        :raises ValueError: If a student already exists or an email is already in use.
+        """
         try:
-            cursor.execute('''
-                INSERT INTO students (student_id, name, age, email)
-                VALUES (?, ?, ?, ?)
-            ''', (student.student_id, student.name, student.age, student.get_email()))
-            conn.commit()
+            self._executemany(_SQL_INSERT_STUDENT, [(student.student_id, student.name, student.age, student.get_email()) for student in students])
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Student already exists or email is already in use: {str(e)}")
-        finally:
-            conn.close()
+        self._invalidate("students")
 
     def get_all_students(self):
         """
         Retrieves all students from the database.
 
+        The records are cached until the students table is next written.
+
         :return: A list of Student objects.
         :rtype: list[Student]
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM students')
-        rows = cursor.fetchall()
-        conn.close()
-        return [Student(row[1], row[2], row[3], row[0]) for row in rows]
+        return self._cached("students", lambda: [
+            Student(row["name"], row["age"], row["email"], row["student_id"])
+            for row in self._fetchall(_SQL_SELECT_STUDENTS)
+        ])
 
     def delete_student(self, student_id):
         """
         Deletes a student from the database by their ID.
 
+        Their course registrations are removed by the ON DELETE CASCADE foreign key.
+
         :param student_id: The ID of the student to delete.
         :type student_id: str
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM students WHERE student_id = ?', (student_id,))
-        cursor.execute('DELETE FROM student_courses WHERE student_id = ?', (student_id,))
-        conn.commit()
-        conn.close()
+        self._execute(_SQL_DELETE_STUDENT, (student_id,))
+        self._invalidate("students")
 
     def add_instructor(self, instructor):
         """
@@ -139,46 +387,47 @@ class DatabaseManager:
         :type instructor: Instructor
         :raises ValueError: If the instructor already exists.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        self.add_instructors_bulk([instructor])
+
+    def add_instructors_bulk(self, instructors):
+        """
+        Adds several instructors to the database in a single transaction.
+
+        :param instructors: The instructor objects to add.
+        :type instructors: list[Instructor]
+        :raises ValueError: If an instructor already exists.
+        """
         try:
-            cursor.execute('''
-                INSERT INTO instructors (instructor_id, name, age, email)
-                VALUES (?, ?, ?, ?)
-            ''', (instructor.instructor_id, instructor.name, instructor.age, instructor.get_email()))
-            conn.commit()
+            self._executemany(_SQL_INSERT_INSTRUCTOR, [(instructor.instructor_id, instructor.name, instructor.age, instructor.get_email()) for instructor in instructors])
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Instructor already exists: {str(e)}")
-        finally:
-            conn.close()
+        self._invalidate("instructors")
 
     def get_all_instructors(self):
         """
         Retrieves all instructors from the database.
 
+        The records are cached until the instructors table is next written.
+
         :return: A list of Instructor objects.
         :rtype: list[Instructor]
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM instructors')
-        rows = cursor.fetchall()
-        conn.close()
-        return [Instructor(row[1], row[2], row[3], row[0]) for row in rows]
+        return self._cached("instructors", lambda: [
+            Instructor(row["name"], row["age"], row["email"], row["instructor_id"])
+            for row in self._fetchall(_SQL_SELECT_INSTRUCTORS)
+        ])
 
     def delete_instructor(self, instructor_id):
         """
         Deletes an instructor from the database by their ID.
 
+        Their course assignments are removed by the ON DELETE CASCADE foreign key.
+
         :param instructor_id: The ID of the instructor to delete.
         :type instructor_id: str
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM instructors WHERE instructor_id = ?', (instructor_id,))
-        cursor.execute('DELETE FROM instructor_courses WHERE instructor_id = ?', (instructor_id,))
-        conn.commit()
-        conn.close()
+        self._execute(_SQL_DELETE_INSTRUCTOR, (instructor_id,))
+        self._invalidate("instructors")
 
     def add_course(self, course):
         """
@@ -188,47 +437,98 @@ class DatabaseManager:
         :type course: Course
         :raises ValueError: If the course already exists.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
+        self.add_courses_bulk([course])
+
+    def add_courses_bulk(self, courses):
+        """
+        Adds several courses to the database in a single transaction.
+
+        :param courses: The course objects to add.
+        :type courses: list[Course]
+        :raises ValueError: If a course already exists.
+        """
         try:
-            cursor.execute('''
-                INSERT INTO courses (course_id, course_name)
-                VALUES (?,?)
-            ''', (course.course_id, course.course_name))
-            conn.commit()
+            self._executemany(_SQL_INSERT_COURSE, [(course.course_id, course.course_name) for course in courses])
         except sqlite3.IntegrityError as e:
             raise ValueError(f"Course already exists: {str(e)}")
-        finally:
-            conn.close()
+        self._invalidate("courses")
 
     def get_all_courses(self):
         """
         Retrieves all courses from the database.
 
+        The records are cached until the courses table is next written.
+
         :return: A list of Course objects.
         :rtype: list[Course]
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM courses')
-        courses = [Course(row[0], row[1]) for row in cursor.fetchall()]
-        conn.close()
-        return courses
+        return self._cached("courses", lambda: [
+            Course(row["course_id"], row["course_name"])
+            for row in self._fetchall(_SQL_SELECT_COURSES)
+        ])
+
+    def get_all_records(self):
+        """
+        Retrieves the display rows of all students, instructors and courses in one query.
+
+        The rows are cached until any of the three tables is next written.
+
+        :return: (type, ID, name, email) rows, students first, then instructors, then courses.
+        :rtype: list[tuple[str, str, str, str]]
+        """
+        return self._cached("records", lambda: [
+            tuple(row) for row in self._fetchall(_SQL_SELECT_ALL_RECORDS)
+        ])
+
+    def get_all_courses_with_relations(self):
+        """
+        Retrieves all courses together with their instructor and enrolled students.
+
+        Everything is loaded with a single joined query. Students and instructors
+        that appear in several courses are shared objects whose registered and
+        assigned course lists are filled in as well.
+
+        :return: A list of Course objects with instructor and enrolled_students populated.
+        :rtype: list[Course]
+        """
+        courses = {}
+        instructors = {}
+        students = {}
+        for (course_id, course_name,
+             instructor_id, instructor_name, instructor_age, instructor_email,
+             student_id, student_name, student_age, student_email) in self._fetchall(_SQL_SELECT_COURSES_WITH_RELATIONS):
+            course = courses.get(course_id)
+            if course is None:
+                course = courses[course_id] = Course(course_id, course_name)
+
+            if instructor_id is not None and course.instructor is None:
+                instructor = instructors.get(instructor_id)
+                if instructor is None:
+                    instructor = instructors[instructor_id] = Instructor(
+                        instructor_name, instructor_age, instructor_email, instructor_id)
+                course.add_instructor(instructor)
+                instructor.assign_course(course)
+
+            if student_id is not None and student_id not in course.enrolled_students:
+                student = students.get(student_id)
+                if student is None:
+                    student = students[student_id] = Student(student_name, student_age, student_email, student_id)
+                course.add_student(student)
+                student.register_course(course)
+
+        return list(courses.values())
 
     def delete_course(self, course_id):
         """
         Deletes a course from the database by its ID.
 
+        Its registrations and assignments are removed by the ON DELETE CASCADE foreign keys.
+
         :param course_id: The ID of the course to delete.
         :type course_id: str
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM courses WHERE course_id = ?', (course_id,))
-        cursor.execute('DELETE FROM student_courses WHERE course_id = ?', (course_id,))
-        cursor.execute('DELETE FROM instructor_courses WHERE course_id = ?', (course_id,))
-        conn.commit()
-        conn.close()
+        self._execute(_SQL_DELETE_COURSE, (course_id,))
+        self._invalidate("courses")
 
     def register_student_course(self, student_id, course_id):
         """
@@ -238,20 +538,26 @@ class DatabaseManager:
         :type student_id: str
         :param course_id: The ID of the course.
         :type course_id: str
-        :raises ValueError: If the registration already exists.
+        :raises ValueError: If the registration already exists or the student or course
+            does not exist.
+        """
+        self.register_student_courses_bulk([(student_id, course_id)])
+
+    def register_student_courses_bulk(self, registrations):
+        """
+        Registers several students for courses in a single transaction.
+
+        :param registrations: A list of (student_id, course_id) pairs.
+        :type registrations: list[tuple(str, str)]
+        :raises ValueError: If a registration already exists or names a student or course
+            that does not exist.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
         try:
-            cursor.execute('''
-                INSERT INTO student_courses (student_id, course_id)
-                VALUES (?, ?)
-            ''', (student_id, course_id))
-            conn.commit()
+            self._executemany(_SQL_INSERT_STUDENT_COURSE, list(registrations))
         except sqlite3.IntegrityError as e:
+            if "FOREIGN KEY" in str(e):
+                raise ValueError(f"Unknown student or course: {str(e)}")
             raise ValueError(f"Registration already exists: {str(e)}")
-        finally:
-            conn.close()
 
     def assign_instructor_course(self, instructor_id, course_id):
         """
@@ -261,24 +567,94 @@ class DatabaseManager:
         :type instructor_id: str
         :param course_id: The ID of the course.
         :type course_id: str
-        :raises ValueError: If the assignment already exists.
+        :raises ValueError: If the assignment already exists or the instructor or course
+            does not exist.
+        """
+        self.assign_instructor_courses_bulk([(instructor_id, course_id)])
+
+    def assign_instructor_courses_bulk(self, assignments):
+        """
+        Assigns several instructors to courses in a single transaction.
+
+        :param assignments: A list of (instructor_id, course_id) pairs.
+        :type assignments: list[tuple(str, str)]
+        :raises ValueError: If an assignment already exists or names an instructor or course
+            that does not exist.
         """
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
         try:
-            cursor.execute('''
-                INSERT INTO instructor_courses (instructor_id, course_id)
-                VALUES (?, ?)
-            ''', (instructor_id, course_id))
-            conn.commit()
+            self._executemany(_SQL_INSERT_INSTRUCTOR_COURSE, list(assignments))
         except sqlite3.IntegrityError as e:
+            if "FOREIGN KEY" in str(e):
+                raise ValueError(f"Unknown instructor or course: {str(e)}")
             raise ValueError(f"Assignment already exists: {str(e)}")
-        finally:
-            conn.close()
+
+    def _sync_from_json(self, statements, document):
+        """
+        Runs a group of JSON-driven statements against one document in a single transaction.
+
+        The document is bound once per statement and shredded into rows by
+        SQLite's json_each, so no Python objects are built per record.
+
+        :param statements: The SQL statements to run, each taking the document as its only parameter.
+        :type statements: tuple[str]
+        :param document: The JSON array, as text or UTF-8 bytes.
+        :type document: str or bytes
+        :raises ValueError: If a record conflicts with existing data or the document is not valid JSON.
+        """
+        if isinstance(document, bytes):
+            document = document.decode("utf-8")
+        try:
+            with self._transaction() as conn:
+                for statement in statements:
+                    conn.execute(statement, (document,))
+        except (sqlite3.IntegrityError, sqlite3.OperationalError) as e:
+            raise ValueError(f"Failed to sync records from JSON: {str(e)}")
+
+    def sync_students_from_json(self, document):
+        """
+        Inserts or updates students from a JSON array in the students.json format.
+
+        Each student's registered_courses are recorded as registrations for
+        courses that already exist in the database.
+
+        :param document: The JSON array, as text or UTF-8 bytes.
+        :type document: str or bytes
+        :raises ValueError: If a record conflicts with existing data or the document is not valid JSON.
+        """
+        self._sync_from_json(_SQL_SYNC_STUDENTS, document)
+        self._invalidate("students")
+
+    def sync_instructors_from_json(self, document):
+        """
+        Inserts or updates instructors from a JSON array in the instructors.json format.
+
+        Each instructor's assigned_courses are recorded as assignments for
+        courses that already exist in the database.
+
+        :param document: The JSON array, as text or UTF-8 bytes.
+        :type document: str or bytes
+        :raises ValueError: If a record conflicts with existing data or the document is not valid JSON.
+        """
+        self._sync_from_json(_SQL_SYNC_INSTRUCTORS, document)
+        self._invalidate("instructors")
+
+    def sync_courses_from_json(self, document):
+        """
+        Inserts or updates courses from a JSON array in the courses.json format.
+
+        Enrolled students and the course instructor are linked when they
+        already exist in the database.
+
+        :param document: The JSON array, as text or UTF-8 bytes.
+        :type document: str or bytes
+        :raises ValueError: If a record conflicts with existing data or the document is not valid JSON.
+        """
+        self._sync_from_json(_SQL_SYNC_COURSES, document)
+        self._invalidate("courses")
 
     def backup_database(self, backup_path=None):
         """
-        Creates a backup of the database file.
+        Creates a backup of the database using SQLite's online backup API.
 
         If no backup path is provided, a timestamped backup file is created
         in the current directory.
@@ -291,9 +667,16 @@ class DatabaseManager:
         if backup_path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = f"backup_{timestamp}.db"
-            
+
         try:
-            shutil.copy2(self.db_name, backup_path)
+            # The online backup API copies pages through SQLite itself, so the
+            # backup is consistent and includes commits still in the WAL.
+            destination = sqlite3.connect(backup_path)
+            try:
+                with self._lock:
+                    self._conn.backup(destination, pages=1000)
+            finally:
+                destination.close()
             return True, f"Database backed up successfully to {backup_path}"
         except Exception as e:
-            return False, f"Backup failed: {str(e)}"
\ No newline at end of file
+            return False, f"Backup failed: {str(e)}"
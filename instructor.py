@@ -15,16 +15,30 @@ class Instructor(Person):
     :type email: str
     :param instructor_id: The unique identifier for the instructor.
     :type instructor_id: str
-    :param assigned_courses: A list of course IDs assigned to the instructor, defaults to None.
-    :type assigned_courses: list[str], optional
+    :param assigned_courses: The IDs of the courses assigned to the instructor, defaults to None.
+        They are stored as a set.
+    :type assigned_courses: iterable[str], optional
     """
+    __slots__ = ("_instructor_id", "assigned_courses")
+
     def __init__(self, name: str, age: int, email: str, instructor_id: str, assigned_courses = None):
         super().__init__(name, age, email)
         self.instructor_id = instructor_id
-        if assigned_courses is None:
-            self.assigned_courses = []
-        else:
-            self.assigned_courses = assigned_courses
+        self.assigned_courses = set(assigned_courses) if assigned_courses is not None else set()
+
+    @property
+    def instructor_id(self):
+        """
+        The instructor's unique identifier. Setting it clears the cached display string.
+
+        :rtype: str
+        """
+        return self._instructor_id
+
+    @instructor_id.setter
+    def instructor_id(self, value):
+        self._instructor_id = value
+        self._display = None
 
     def assign_course(self, course):
         """
@@ -35,8 +49,7 @@ class Instructor(Person):
         :param course: The course to assign.
         :type course: Course
         """
-        if course.course_id not in self.assigned_courses:
-            self.assigned_courses.append(course.course_id)
+        self.assigned_courses.add(course.course_id)
         
     def to_dict(self):
         """
@@ -48,7 +61,7 @@ class Instructor(Person):
         data = super().to_dict()
         data.update({
             "instructor_id": self.instructor_id,
-            "assigned_courses": self.assigned_courses
+            "assigned_courses": sorted(self.assigned_courses)
         })
         return data
     
@@ -76,7 +89,11 @@ class Instructor(Person):
         """
         Generates a human-readable string for the instructor object.
 
+        The string is built once and reused until the ID or name changes.
+
         :return: A formatted string with the instructor's ID and name.
         :rtype: str
         """
-        return f"{self.instructor_id} - {self.name}"
+        if self._display is None:
+            self._display = f"{self.instructor_id} - {self.name}"
+        return self._display
@@ -3,6 +3,8 @@ This module defines the base Person class.
 """
 import re
 
+EMAIL_PATTERN = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+
 class Person:
     """
     Represents a person with a name, age, and email address.
@@ -14,11 +16,28 @@ class Person:
     :param email: The email address of the person.
     :type email: str
     """
+    __slots__ = ("_name", "age", "_email", "_display")
+
     def __init__(self, name: str, age: int, email: str):
+        self._display = None
         self.name = name.strip()
         self.age = self.validate_age(age)
         self._email = self.validate_email(email)
         
+    @property
+    def name(self):
+        """
+        The person's name. Setting it clears the cached display string.
+
+        :rtype: str
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._display = None
+
     @staticmethod
     def validate_name(name):
         """
@@ -49,8 +68,7 @@ class Person:
         """
         if not email:
             raise ValueError("Email cannot be empty")
-        pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$'
-        if re.match(pattern, email):
+        if EMAIL_PATTERN.match(email):
             return email
         raise ValueError("Invalid email format")
 
@@ -65,6 +83,11 @@ class Person:
         :return: The validated age as an integer.
         :rtype: int
         """
+        # Ages loaded from the database or JSON are already ints, so skip the conversion.
+        if type(age) is int:
+            if 1 <= age <= 120:
+                return age
+            raise ValueError("Age must be between 1 and 120.")
         if age is None:
             raise ValueError("Age cannot be empty")
         try:
@@ -9,6 +9,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QGroupBox, QLabel, QComboBox, QPushButton, QMessageBox, QGridLayout
 )
+from qt_forms.combo_helpers import ObjectListModel
 
 def clear_dropdowns(instructor_box, course_box):
     """
@@ -27,7 +28,7 @@ def clear_dropdowns(instructor_box, course_box):
     except Exception:
         pass
 
-def build_assignment_tab(parent, instructors, courses, refresh_cb):
+def build_assignment_tab(parent, instructors, courses, refresh_cb, course_model=None):
     """
     Builds the 'Instructor Assignment' tab for the PyQt5 UI.
 
@@ -41,6 +42,9 @@ def build_assignment_tab(parent, instructors, courses, refresh_cb):
     :type courses: list[Course]
     :param refresh_cb: A callback function to refresh the main application's data view.
     :type refresh_cb: callable
+    :param course_model: A course list model shared with other tabs, defaults to None.
+                         A private model is created when omitted.
+    :type course_model: ObjectListModel, optional
     :return: The group box containing the assignment UI. It includes a 'refresh_boxes'
              method to allow external updates to the dropdowns.
     :rtype: QGroupBox
@@ -60,13 +64,16 @@ def build_assignment_tab(parent, instructors, courses, refresh_cb):
     instructor_box  = QComboBox(frame)
     instructor_box.setEditable(False)  
     instructor_box.setMinimumContentsLength(40)
-    instructor_box.addItems([instructor.display_instructor() for instructor in instructors])
+    instructor_model = ObjectListModel(instructors, lambda instructor: instructor.display_instructor(), frame)
+    instructor_box.setModel(instructor_model)
     layout.addWidget(instructor_box, 0, 1)
 
     course_box = QComboBox(frame)
     course_box.setEditable(False)
     course_box.setMinimumContentsLength(40)
-    course_box.addItems([course.display_course() for course in courses])
+    if course_model is None:
+        course_model = ObjectListModel(courses, lambda course: course.display_course(), frame)
+    course_box.setModel(course_model)
     layout.addWidget(course_box, 1, 1)
 
     def refresh_boxes():
@@ -76,11 +83,8 @@ def build_assignment_tab(parent, instructors, courses, refresh_cb):
         instructor_box.blockSignals(True)
         course_box.blockSignals(True)
 
-        instructor_box.clear()
-        instructor_box.addItems([instructor.display_instructor() for instructor in instructors])
-
-        course_box.clear()
-        course_box.addItems([course.display_course() for course in courses])
+        instructor_model.refresh()
+        course_model.refresh()
 
 
         # clear
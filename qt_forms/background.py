@@ -0,0 +1,94 @@
+"""
+This module runs blocking work, such as file I/O, off the GUI thread for the
+PyQt5 forms and hands the outcome back to the GUI thread.
+"""
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+_pool = None
+# Signal carriers of jobs that have not reported back yet, kept alive until they do
+_pending = set()
+
+
+class _JobSignals(QObject):
+    """
+    Carries a job's outcome from the worker thread to the GUI thread.
+    """
+    finished = pyqtSignal(object, object)
+
+
+class _Job(QRunnable):
+    """
+    Runs a callable on a pool thread and emits its result or exception.
+
+    :param work: The callable to run; it must not touch any widget.
+    :type work: callable
+    :param signals: The signal carrier created on the GUI thread.
+    :type signals: _JobSignals
+    """
+
+    def __init__(self, work, signals):
+        super().__init__()
+        self._work = work
+        self._signals = signals
+
+    def run(self):
+        """
+        Runs the work and emits (result, None) or (None, exception).
+        """
+        try:
+            result = self._work()
+        except Exception as e:
+            self._signals.finished.emit(None, e)
+        else:
+            self._signals.finished.emit(result, None)
+
+
+def _get_pool():
+    """
+    Returns the pool the jobs run on, creating it on first use.
+
+    It has a single thread, so jobs run one at a time in submission order
+    and two jobs never write the same file at once.
+
+    :return: The job pool.
+    :rtype: QThreadPool
+    """
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(1)
+    return _pool
+
+
+def run_in_background(work, on_done):
+    """
+    Runs work() on a background thread and then calls on_done on the GUI thread.
+
+    on_done receives (result, None) when the work returns and (None, exception)
+    when it raises, so all widget updates happen in on_done.
+
+    :param work: The blocking callable to run; it must not touch any widget.
+    :type work: callable
+    :param on_done: Called with the result and the exception, if any.
+    :type on_done: callable
+    """
+    # Created here, so it belongs to the GUI thread and its signal is queued back to it.
+    signals = _JobSignals()
+    _pending.add(signals)
+
+    def finish(result, error):
+        _pending.discard(signals)
+        on_done(result, error)
+
+    signals.finished.connect(finish)
+    _get_pool().start(_Job(work, signals))
+
+
+def wait_for_background():
+    """
+    Blocks until every job submitted with run_in_background has finished.
+
+    Call this before closing anything the jobs use, such as a database connection.
+    """
+    if _pool is not None:
+        _pool.waitForDone()
@@ -0,0 +1,163 @@
+"""
+This module provides helpers shared by the PyQt5 forms that display
+records in comboboxes.
+"""
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QComboBox
+
+
+class ObjectListModel(QAbstractListModel):
+    """
+    A read-only list model backed directly by a Python list of records.
+
+    No item is copied into Qt; the display text of a row is produced only when
+    the view asks for it, so a combobox over a large catalog only formats the
+    rows it actually paints. Comboboxes that use the same model show the same
+    items, so a refresh only has to update the model once.
+
+    :param objects: The list of records to show. It is read live, not copied.
+    :type objects: list
+    :param display: A function returning the display text of a record.
+    :type display: callable
+    :param parent: The Qt object that owns the model, defaults to None.
+    :type parent: QObject, optional
+    """
+
+    def __init__(self, objects, display, parent=None):
+        super().__init__(parent)
+        self._objects = objects
+        self._display = display
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Returns the number of records in the backing list.
+
+        :param parent: The parent index; list models only have a root.
+        :type parent: QModelIndex
+        :return: The number of rows.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self._objects)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Returns the display text of the record at the given index.
+
+        :param index: The index of the requested row.
+        :type index: QModelIndex
+        :param role: The requested data role.
+        :type role: int
+        :return: The display text, or None for other roles and invalid indexes.
+        :rtype: str or None
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        # A view may still ask for a row the list lost before refresh() ran
+        row = index.row()
+        if row >= len(self._objects):
+            return None
+        return self._display(self._objects[row])
+
+    def refresh(self):
+        """
+        Notifies attached views that the backing list has changed.
+
+        Rows may have been added or removed, so the model is reset rather than
+        only re-laid out; views then re-read the row count and visible rows.
+        """
+        self.beginResetModel()
+        self.endResetModel()
+
+
+class LazyComboBox(QComboBox):
+    """
+    A combobox that loads its items only when the user first interacts with it.
+
+    The loader runs before the popup opens, the box gains focus or the mouse
+    wheel scrolls it, the first time and again after invalidate() is called.
+    Every way of picking an item therefore sees the current records, while
+    changes to the data cost nothing until the user actually uses the box.
+
+    :param loader: Called with the combobox to clear and refill its items.
+    :type loader: callable
+    :param parent: The parent widget, defaults to None.
+    :type parent: QWidget, optional
+    """
+
+    def __init__(self, loader, parent=None):
+        super().__init__(parent)
+        self._loader = loader
+        self._dirty = True
+
+    def invalidate(self):
+        """
+        Marks the items as out of date so they are reloaded before the next use.
+        """
+        self._dirty = True
+
+    def _ensure_loaded(self):
+        """
+        Reloads the items if they are out of date.
+        """
+        if self._dirty:
+            self._dirty = False
+            self.blockSignals(True)
+            try:
+                self._loader(self)
+            finally:
+                self.blockSignals(False)
+
+    def showPopup(self):
+        """
+        Reloads the items if they are out of date, then opens the popup.
+        """
+        self._ensure_loaded()
+        super().showPopup()
+
+    def focusInEvent(self, event):
+        """
+        Reloads the items if they are out of date before the arrow keys can pick one.
+
+        :param event: The focus event.
+        :type event: QFocusEvent
+        """
+        self._ensure_loaded()
+        super().focusInEvent(event)
+
+    def wheelEvent(self, event):
+        """
+        Reloads the items if they are out of date before the wheel picks one.
+
+        :param event: The wheel event.
+        :type event: QWheelEvent
+        """
+        self._ensure_loaded()
+        super().wheelEvent(event)
+
+
+def set_object_items(box, objects, display):
+    """
+    Replaces the items of a combobox with one item per record and clears its selection.
+
+    The items are added to a new model in a single batch, and each one keeps
+    its record under Qt.UserRole, so the selected record is read back with
+    box.currentData(Qt.UserRole).
+
+    :param box: The combobox to fill.
+    :type box: QComboBox
+    :param objects: The records to show, in display order.
+    :type objects: iterable
+    :param display: A function returning the display text of a record.
+    :type display: callable
+    """
+    items = []
+    for obj in objects:
+        item = QStandardItem(display(obj))
+        item.setData(obj, Qt.UserRole)
+        items.append(item)
+    model = QStandardItemModel(box)
+    model.invisibleRootItem().appendRows(items)
+    # The combobox deletes its previous model, which it owns
+    box.setModel(model)
+    box.setCurrentIndex(-1)
@@ -5,14 +5,14 @@ It includes a form for entering course details and handles the creation
 of course records, which are managed in-memory.
 """
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QLineEdit, QPushButton, QMessageBox, QGridLayout
+    QGroupBox, QLabel, QPushButton
 )
 from course import Course
 from validators import require, validate_unique_id
+from qt_forms.form_helpers import COURSE_FIELDS, add_button_row, build_field_form, flash_status
 
-def build_course_tab(parent, courses, refresh_cb):
+def build_course_tab(parent, courses, refresh_cb, courses_by_id=None):
     """
     Builds the 'Add Course' tab for the PyQt5 UI.
 
@@ -25,25 +25,22 @@ def build_course_tab(parent, courses, refresh_cb):
     :type courses: list[Course]
     :param refresh_cb: A callback function to refresh the main application's data view.
     :type refresh_cb: callable
+    :param courses_by_id: The courses in the list keyed by ID, shared with other tabs that
+        change it. Built from the list when not given, defaults to None.
+    :type courses_by_id: dict[str, Course], optional
     :return: The group box containing the course creation UI.
     :rtype: QGroupBox
     """
-    frame = QGroupBox("Add Course", parent)
-
-    layout = QGridLayout(frame)
-    layout.setContentsMargins(10, 10, 10, 10)
+    if courses_by_id is None:
+        courses_by_id = {str(course.course_id): course for course in courses}
 
-    # Labls
-    tk_label_id = QLabel("Course ID:", frame)
-    layout.addWidget(tk_label_id, 0, 0)
-    tk_label_name = QLabel("Course Name:", frame)
-    layout.addWidget(tk_label_name, 1, 0)
+    frame = QGroupBox("Add Course", parent)
 
-    id_input   = QLineEdit(frame)
-    name_input = QLineEdit(frame)
+    layout, inputs = build_field_form(frame, COURSE_FIELDS)
+    id_input   = inputs["id"]
+    name_input = inputs["name"]
 
-    layout.addWidget(id_input,   0, 1)
-    layout.addWidget(name_input, 1, 1)
+    status_label = QLabel("", frame)
 
     def add_course():
         """
@@ -56,18 +53,19 @@ def build_course_tab(parent, courses, refresh_cb):
         if not (require(course_id, "Course ID") and require(course_name, "Course Name")):
             return
 
-        if not validate_unique_id(course_id, courses, "course_id"):
+        if not validate_unique_id(course_id, courses_by_id, "course_id"):
             return
 
         course = Course(course_id=course_id, course_name=course_name)
         courses.append(course)
-        QMessageBox.information(frame, "Success", "Course Added!")
+        courses_by_id[course_id] = course
+        flash_status(status_label, "Course Added!")
         id_input.clear()
         name_input.clear()
         refresh_cb()
 
     add_button = QPushButton("Add Course", frame)
     add_button.clicked.connect(add_course)
-    layout.addWidget(add_button, 2, 1,  alignment=Qt.AlignRight)
+    add_button_row(layout, add_button, status_label)
 
     return frame
@@ -0,0 +1,91 @@
+"""
+This module provides helpers shared by the PyQt5 forms that lay out
+labelled input fields and report their outcome.
+"""
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QFormLayout, QHBoxLayout, QLineEdit
+
+# (label, key) for each input row of the add forms, top to bottom
+STUDENT_FIELDS = (
+    ("Name:", "name"),
+    ("Age:", "age"),
+    ("Email:", "email"),
+    ("Student ID:", "id"),
+)
+INSTRUCTOR_FIELDS = (
+    ("Name:", "name"),
+    ("Age:", "age"),
+    ("Email:", "email"),
+    ("Instructor ID:", "id"),
+)
+COURSE_FIELDS = (
+    ("Course ID:", "id"),
+    ("Course Name:", "name"),
+)
+
+def build_field_form(frame, fields):
+    """
+    Lays out one labelled line edit per field in a form layout on the frame.
+
+    Each field is added as a single label/input row, in the order given, so a
+    form is described by its field table alone.
+
+    :param frame: The widget that owns the layout and the new widgets.
+    :type frame: QWidget
+    :param fields: (label text, key) pairs, one per row, in display order.
+    :type fields: tuple[tuple[str, str], ...]
+    :return: The form layout and the line edits keyed by field key.
+    :rtype: tuple(QFormLayout, dict[str, QLineEdit])
+    """
+    layout = QFormLayout(frame)
+    layout.setContentsMargins(10, 10, 10, 10)
+
+    inputs = {}
+    for label, key in fields:
+        inputs[key] = QLineEdit(frame)
+        layout.addRow(label, inputs[key])
+    return layout, inputs
+
+
+def add_button_row(layout, button, label=None):
+    """
+    Adds a row to a form layout with the button aligned right.
+
+    :param layout: The form layout to add the row to.
+    :type layout: QFormLayout
+    :param button: The button to place at the right of the row.
+    :type button: QPushButton
+    :param label: A widget for the label column, such as a status label; without
+        one the row spans both columns, defaults to None.
+    :type label: QWidget, optional
+    """
+    buttons = QHBoxLayout()
+    buttons.addStretch(1)
+    buttons.addWidget(button)
+    if label is None:
+        layout.addRow(buttons)
+    else:
+        layout.addRow(label, buttons)
+
+
+def flash_status(label, text, msec=2000):
+    """
+    Shows a message in a status label and clears it after a moment.
+
+    Forms use this to report success inline instead of through a modal
+    dialog. A new message restarts the countdown.
+
+    :param label: The label to show the message in.
+    :type label: QLabel
+    :param text: The message to show.
+    :type text: str
+    :param msec: How long the message stays, in milliseconds, defaults to 2000.
+    :type msec: int, optional
+    """
+    timer = getattr(label, "_flash_timer", None)
+    if timer is None:
+        timer = label._flash_timer = QTimer(label)
+        timer.setSingleShot(True)
+        timer.timeout.connect(label.clear)
+    label.setText(text)
+    timer.start(msec)
@@ -5,14 +5,17 @@ It includes a form for entering instructor details and handles the creation
 of instructor records, which are managed in-memory.
 """
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QRegularExpression
+from PyQt5.QtGui import QIntValidator, QRegularExpressionValidator
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QLineEdit, QPushButton, QMessageBox, QGridLayout
+    QGroupBox, QLabel, QPushButton
 )
 from instructor import Instructor
+from person import EMAIL_PATTERN
 from validators import validate_name, validate_age, validate_email, require, validate_unique_id
+from qt_forms.form_helpers import INSTRUCTOR_FIELDS, add_button_row, build_field_form, flash_status
 
-def build_instructor_tab(parent, instructors, refresh_cb):
+def build_instructor_tab(parent, instructors, refresh_cb, instructors_by_id=None):
     """
     Builds the 'Add Instructor' tab for the PyQt5 UI.
 
@@ -25,37 +28,30 @@ def build_instructor_tab(parent, instructors, refresh_cb):
     :type instructors: list[Instructor]
     :param refresh_cb: A callback function to refresh the main application's data view.
     :type refresh_cb: callable
+    :param instructors_by_id: The instructors in the list keyed by ID, shared with other tabs
+        that change it. Built from the list when not given, defaults to None.
+    :type instructors_by_id: dict[str, Instructor], optional
     :return: The group box containing the instructor creation UI.
     :rtype: QGroupBox
     """
-    frame = QGroupBox("Add Instructor", parent)
-
-    layout = QGridLayout(frame)
-    layout.setContentsMargins(10, 10, 10, 10)
-
-    QLabel("Name:").setParent(frame)
-    tk_label_name = QLabel("Name:", frame)
-    layout.addWidget(tk_label_name, 0, 0)
-
-    tk_label_age = QLabel("Age:", frame)
-    layout.addWidget(tk_label_age, 1, 0)
+    if instructors_by_id is None:
+        instructors_by_id = {str(instructor.instructor_id): instructor for instructor in instructors}
 
-    tk_label_email = QLabel("Email:", frame)
-    layout.addWidget(tk_label_email, 2, 0)
-
-    tk_label_id = QLabel("Instructor ID:", frame)
-    layout.addWidget(tk_label_id, 3, 0)
+    frame = QGroupBox("Add Instructor", parent)
 
+    layout, inputs = build_field_form(frame, INSTRUCTOR_FIELDS)
     # keep variable names identical
-    name_input  = QLineEdit(frame)
-    age_input   = QLineEdit(frame)
-    email_input = QLineEdit(frame)
-    id_input    = QLineEdit(frame)
+    name_input  = inputs["name"]
+    age_input   = inputs["age"]
+    email_input = inputs["email"]
+    id_input    = inputs["id"]
+
+    # Reject non-numeric ages and characters an email cannot contain while typing;
+    # the submit checks below still report empty or incomplete values.
+    age_input.setValidator(QIntValidator(1, 120, frame))
+    email_input.setValidator(QRegularExpressionValidator(QRegularExpression(EMAIL_PATTERN.pattern), frame))
 
-    layout.addWidget(name_input,  0, 1)
-    layout.addWidget(age_input,   1, 1)
-    layout.addWidget(email_input, 2, 1)
-    layout.addWidget(id_input,    3, 1)
+    status_label = QLabel("", frame)
 
     def add_instructor():
         """
@@ -67,17 +63,18 @@ def build_instructor_tab(parent, instructors, refresh_cb):
         email = email_input.text().strip()
         iid   = id_input.text().strip()
 
-        # validate inpts
-        if not (validate_name(name) and validate_age(age) and validate_email(email) and require(iid, "Instructor ID")):
+        # validate inpts, cheapest checks first so a reject never reaches the email regex
+        if not (require(iid, "Instructor ID") and validate_age(age) and validate_name(name) and validate_email(email)):
             return
 
         # check unique ID
-        if not validate_unique_id(iid, instructors, "instructor_id"):
+        if not validate_unique_id(iid, instructors_by_id, "instructor_id"):
             return
 
         instructor = Instructor(name=name, age=age, email=email, instructor_id=iid)
         instructors.append(instructor)
-        QMessageBox.information(frame, "Success", "Instructor Added!")
+        instructors_by_id[iid] = instructor
+        flash_status(status_label, "Instructor Added!")
 
         name_input.clear()
         age_input.clear()
@@ -88,6 +85,6 @@ def build_instructor_tab(parent, instructors, refresh_cb):
 
     add_button = QPushButton("Add Instructor", frame)
     add_button.clicked.connect(add_instructor)
-    layout.addWidget(add_button, 4, 1, alignment=Qt.AlignRight)
+    add_button_row(layout, add_button, status_label)
 
     return frame
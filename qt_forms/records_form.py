@@ -8,12 +8,19 @@ with data managed in-memory.
 from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import (
     QComboBox, QDialog, QFileDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit,
-    QMessageBox, QPushButton, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+    QMessageBox, QPushButton, QTreeView, QVBoxLayout, QWidget
 )
 from data_manager import DataManager
 import csv
+import io
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from datetime import datetime
 from validators import validate_name, validate_age, validate_email, require, validate_unique_id
+from qt_forms.background import run_in_background
+from qt_forms.records_model import RecordsModel
+from qt_forms.search_helpers import build_search_index, connect_search
 
 STUDENTS_FILE = "students.json"
 INSTRUCTORS_FILE = "instructors.json"
@@ -26,10 +33,10 @@ def student_row(student):
 
     :param student: The student object.
     :type student: Student
-    :return: A tuple of student's details.
-    :rtype: tuple
+    :return: A tuple of student's details, as display strings.
+    :rtype: tuple[str, str, str, str]
     """
-    return ("Student", student.student_id, student.name, student.get_email())
+    return ("Student", str(student.student_id), student.name or "", student.get_email() or "")
 
 
 def instructor_row(instructor):
@@ -38,10 +45,10 @@ def instructor_row(instructor):
 
     :param instructor: The instructor object.
     :type instructor: Instructor
-    :return: A tuple of instructor's details.
-    :rtype: tuple
+    :return: A tuple of instructor's details, as display strings.
+    :rtype: tuple[str, str, str, str]
     """
-    return ("Instructor", instructor.instructor_id, instructor.name, instructor.get_email())
+    return ("Instructor", str(instructor.instructor_id), instructor.name or "", instructor.get_email() or "")
 
 
 def course_row(course):
@@ -50,31 +57,36 @@ def course_row(course):
 
     :param course: The course object.
     :type course: Course
-    :return: A tuple of course's details.
-    :rtype: tuple
+    :return: A tuple of course's details, as display strings.
+    :rtype: tuple[str, str, str, str]
     """
-    return ("Course", course.course_id, course.course_name, "-")
+    return ("Course", str(course.course_id), course.course_name or "", "-")
 
 
-def insert_row(tree, row):
+def record_rows(students, instructors, courses):
     """
-    Inserts a new row into the tree widget.
+    Formats every record for display, students first, then instructors, then courses.
 
-    :param tree: The QTreeWidget to insert into.
-    :type tree: QTreeWidget
-    :param row: A tuple of data for the row.
-    :type row: tuple
+    :param students: List of student objects.
+    :type students: list[Student]
+    :param instructors: List of instructor objects.
+    :type instructors: list[Instructor]
+    :param courses: List of course objects.
+    :type courses: list[Course]
+    :return: The display rows, in display order.
+    :rtype: iterator[tuple[str, str, str, str]]
     """
-    item = QTreeWidgetItem([str(x) if x is not None else "" for x in row])
-    tree.addTopLevelItem(item)
+    return chain(map(student_row, students),
+                 map(instructor_row, instructors),
+                 map(course_row, courses))
 
 
 def fill_tree(tree, students, instructors, courses):
     """
-    Populates the tree widget with all records.
+    Shows all records in the tree view.
 
-    :param tree: The QTreeWidget to populate.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to populate.
+    :type tree: QTreeView
     :param students: List of student objects.
     :type students: list[Student]
     :param instructors: List of instructor objects.
@@ -82,20 +94,15 @@ def fill_tree(tree, students, instructors, courses):
     :param courses: List of course objects.
     :type courses: list[Course]
     """
-    for student in students:
-        insert_row(tree, student_row(student))
-    for instructor in instructors:
-        insert_row(tree, instructor_row(instructor))
-    for course in courses:
-        insert_row(tree, course_row(course))
+    tree.model().set_rows(record_rows(students, instructors, courses))
 
 
 def refresh_tree(tree, students, instructors, courses):
     """
-    Clears and refills the tree widget with the latest data.
+    Replaces the rows of the tree view with the latest data.
 
-    :param tree: The QTreeWidget to refresh.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to refresh.
+    :type tree: QTreeView
     :param students: List of student objects.
     :type students: list[Student]
     :param instructors: List of instructor objects.
@@ -103,16 +110,16 @@ def refresh_tree(tree, students, instructors, courses):
     :param courses: List of course objects.
     :type courses: list[Course]
     """
-    tree.clear()
+    # The model swaps all rows in one reset, so the emptied view is never drawn
     fill_tree(tree, students, instructors, courses)
 
 
-def apply_search(tree, query_entry, scope_combo, students, instructors, courses):
+def apply_search(tree, query_entry, scope_combo, students, instructors, courses, search_cache=None):
     """
-    Filters the records in the tree widget based on a search query.
+    Filters the records in the tree view based on a search query.
 
-    :param tree: The QTreeWidget to search in.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to search in.
+    :type tree: QTreeView
     :param query_entry: The QLineEdit with the search query.
     :type query_entry: QLineEdit
     :param scope_combo: The QComboBox for search scope.
@@ -123,48 +130,40 @@ def apply_search(tree, query_entry, scope_combo, students, instructors, courses)
     :type instructors: list[Instructor]
     :param courses: List of course objects.
     :type courses: list[Course]
+    :param search_cache: Holds the search index and the last query, scope and hits between
+        searches; the owner clears it whenever the records change. A fresh index is built when
+        not given, defaults to None.
+    :type search_cache: dict, optional
     """
     search_input = query_entry.text().strip().lower()
     scope = scope_combo.currentText()
-    tree.clear()
-
-    if not search_input:
-        # Show everything if no search query
-        rows = []
-        if scope in ("All", "Students"):
-            rows += [student_row(student) for student in students]
-        if scope in ("All", "Instructors"):
-            rows += [instructor_row(instructor) for instructor in instructors]
-        if scope in ("All", "Courses"):
-            rows += [course_row(course) for course in courses]
-
-        for r in rows:
-            insert_row(tree, r)
-        return
-
-
-    def record_matches(row):
-        record_type, record_id, name, email = row
-
-        if (search_input in str(record_id).lower() or
-            search_input in (name or "").lower() or
-            search_input in (email or "").lower()):
-            return True
-        
-        return False
-
-    # Build filtered results
-    rows = []
-    if scope in ("All", "Students"):
-        rows += [student_row(student) for student in students]
-    if scope in ("All", "Instructors"):
-        rows += [instructor_row(instructor) for instructor in instructors]
-    if scope in ("All", "Courses"):
-        rows += [course_row(course) for course in courses]
 
-    for row in rows:
-        if record_matches(row):
-            insert_row(tree, row)
+    if search_cache is None:
+        search_cache = {}
+    index = search_cache.get("index")
+    if index is None:
+        index = search_cache["index"] = build_search_index(record_rows(students, instructors, courses))
+
+    # A query that extends the previous one in the same scope can only match a
+    # subset of the previous hits, so only those need to be tested again.
+    if ("query" in search_cache and scope == search_cache["scope"]
+            and search_input.startswith(search_cache["query"])):
+        candidates = search_cache["hits"]
+    else:
+        candidates = index
+
+    any_scope = scope == "All"
+    if search_input:
+        hits = [entry for entry in candidates
+                if (any_scope or entry[0] == scope) and search_input in entry[2]]
+    elif any_scope:
+        # An empty query matches every row, so no haystack needs testing
+        hits = candidates
+    else:
+        hits = [entry for entry in candidates if entry[0] == scope]
+    search_cache.update(query=search_input, scope=scope, hits=hits)
+
+    tree.model().set_rows(row for _, row, _ in hits)
 
 
 def reset_search(query_entry, scope_combo, refresh_fn):
@@ -185,13 +184,15 @@ def reset_search(query_entry, scope_combo, refresh_fn):
 
 def export_to_csv(tree):
     """
-    Exports the data from the tree widget to a CSV file.
+    Exports the data from the tree view to a CSV file.
 
-    :param tree: The QTreeWidget containing the data.
-    :type tree: QTreeWidget
+    The file is written in the background and the outcome is reported when it finishes.
+
+    :param tree: The QTreeView containing the data.
+    :type tree: QTreeView
     """
-    top_count = tree.topLevelItemCount()
-    if top_count == 0:
+    model = tree.model()
+    if model.rowCount() == 0:
         QMessageBox.warning(tree, "Export Warning", "No records to export!")
         return
 
@@ -205,26 +206,29 @@ def export_to_csv(tree):
     if not filename:
         return
 
-    try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
+    # Read the rows on the GUI thread; only the file write runs in the background
+    headers = model.headers()
+    rows = model.rows()
 
-            # Write headers
-            headers = [tree.headerItem().text(instructor) for instructor in range(tree.columnCount())]
-            writer.writerow(headers)
+    def write_csv():
+        # Format the whole file in memory, then write it with a single call
+        buffer = io.StringIO(newline='')
+        writer = csv.writer(buffer)
+        writer.writerow(headers)
+        writer.writerows(rows)
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write(buffer.getvalue())
 
-            # Write data
-            for instructor in range(top_count):
-                item = tree.topLevelItem(instructor)
-                row = [item.text(col) for col in range(tree.columnCount())]
-                writer.writerow(row)
+    def on_done(_, error):
+        if error is None:
+            QMessageBox.information(tree, "Export Successful", f"Records have been exported to {filename}")
+        else:
+            QMessageBox.critical(tree, "Export Error", f"Failed to export records: {str(error)}")
 
-        QMessageBox.information(tree, "Export Successful", f"Records have been exported to {filename}")
-    except Exception as e:
-        QMessageBox.critical(tree, "Export Error", f"Failed to export records: {str(e)}")
+    run_in_background(write_csv, on_done)
 
 
-def open_person_edit_dialog(parent, person, person_type, students, instructors, courses, refresh_fn):
+def open_person_edit_dialog(parent, person, person_type, students, instructors, courses, refresh_fn, id_index):
     """
     Opens a dialog to edit a person's (student/instructor) details.
 
@@ -242,6 +246,8 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
     :type courses: list[Course]
     :param refresh_fn: Callback to refresh the main view.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     if not person:
         QMessageBox.critical(parent, "Error", "Person not found.")
@@ -298,15 +304,14 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
         email = email_input.text().strip()
         new_id = id_input.text().strip()
 
-        # Validation
-        if not all([validate_name(name), validate_age(age_str),
-                    validate_email(email), require(new_id, f"{person_type.title()} ID")]):
+        # Validation stops at the first failure, so only one warning is shown
+        if not (validate_name(name) and validate_age(age_str) and
+                validate_email(email) and require(new_id, f"{person_type.title()} ID")):
             return
 
         # Check ID uniqueness
-        id_pool = students if person_type == "student" else instructors
         id_field = f"{person_type}_id"
-        if not validate_unique_id(new_id, id_pool, id_field, exclude=person):
+        if not validate_unique_id(new_id, id_index[id_field], id_field, exclude=person):
             return
 
         # Save changes
@@ -321,18 +326,17 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
             return
 
         setattr(person, id_field, new_id)
+        id_index[id_field].pop(str(old_id), None)
+        id_index[id_field][new_id] = person
 
-        # Update course references if ID changed
-        if old_id != new_id:
-            if person_type == "student":
-                for course in courses:
-                    for index, student in enumerate(getattr(course, "enrolled_students", [])):
-                        if student is person:
-                            course.enrolled_students[index] = person
-            else:  # instructor
-                for course in courses:
-                    if getattr(course, "instructor", None) is person:
-                        course.instructor = person
+        # Courses key their enrollments by student ID. Courses loaded from JSON hold their own
+        # copy of the student and may not match registered_courses, so every course is checked.
+        # Courses refer to instructors by object, so an instructor's ID change needs no update.
+        if old_id != new_id and person_type == "student":
+            for course in courses:
+                if old_id in course.enrolled_students:
+                    del course.enrolled_students[old_id]
+                    course.enrolled_students[new_id] = person
 
         dialog.accept()
         refresh_fn()
@@ -343,7 +347,7 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
     dialog.exec_()
 
 
-def open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn):
+def open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn, id_index):
     """
     Opens a dialog to edit a course's details.
 
@@ -359,6 +363,8 @@ def open_course_edit_dialog(parent, course, students, instructors, courses, refr
     :type courses: list[Course]
     :param refresh_fn: Callback to refresh the main view.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     if not course:
         QMessageBox.critical(parent, "Error", "Course not found.")
@@ -407,22 +413,26 @@ def open_course_edit_dialog(parent, course, students, instructors, courses, refr
         if not (require(new_id, "Course ID") and require(new_name, "Course Name")):
             return
 
-        if not validate_unique_id(new_id, courses, "course_id", exclude=course):
+        if not validate_unique_id(new_id, id_index["course_id"], "course_id", exclude=course):
             return
 
         course.course_id = new_id
+        id_index["course_id"].pop(str(old_id), None)
+        id_index["course_id"][new_id] = course
         course.course_name = new_name
 
         # Update references in student/instructor lists
         if old_id != new_id:
+            # Courses loaded from JSON do not keep their enrolled students, so check every student
             for student in students:
-                for index, course in enumerate(getattr(student, "registered_courses", [])):
-                    if course == old_id:
-                        student.registered_courses[index] = new_id
+                if old_id in student.registered_courses:
+                    student.registered_courses.discard(old_id)
+                    student.registered_courses.add(new_id)
+            # Courses loaded from JSON do not keep their instructor, so check every instructor
             for instructor in instructors:
-                for index, course in enumerate(getattr(instructor, "assigned_courses", [])):
-                    if course is course:
-                        instructor.assigned_courses[index] = course
+                if old_id in instructor.assigned_courses:
+                    instructor.assigned_courses.discard(old_id)
+                    instructor.assigned_courses.add(new_id)
 
         dialog.accept()
         refresh_fn()
@@ -435,26 +445,25 @@ def open_course_edit_dialog(parent, course, students, instructors, courses, refr
 
 def get_selected_row(tree):
     """
-    Retrieves the data from the currently selected row in the tree widget.
+    Retrieves the data from the currently selected row in the tree view.
 
-    :param tree: The QTreeWidget to get the selection from.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to get the selection from.
+    :type tree: QTreeView
     :return: A tuple of the selected row's data, or None.
     :rtype: tuple or None
     """
-    items = tree.selectedItems()
-    if not items:
+    indexes = tree.selectionModel().selectedRows()
+    if not indexes:
         return None
-    item = items[0]
-    return tuple(item.text(index) for index in range(tree.columnCount()))
+    return tree.model().row(indexes[0].row())
 
 
-def edit_selected(tree, parent, students, instructors, courses, refresh_fn):
+def edit_selected(tree, parent, students, instructors, courses, refresh_fn, id_index):
     """
     Opens the appropriate edit dialog for the selected record.
 
-    :param tree: The QTreeWidget with the selection.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView with the selection.
+    :type tree: QTreeView
     :param parent: The parent widget for the dialog.
     :type parent: QWidget
     :param students: List of all student objects.
@@ -465,31 +474,33 @@ def edit_selected(tree, parent, students, instructors, courses, refresh_fn):
     :type courses: list[Course]
     :param refresh_fn: Callback to refresh the main view.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
-    selection = tree.selectedItems()
-    if not selection:
+    selected = get_selected_row(tree)
+    if selected is None:
         QMessageBox.warning(parent, "No Selection", "Please select a record to edit.")
         return
 
-    record_type, record_id, *_ = get_selected_row(tree)
+    record_type, record_id, *_ = selected
 
     if record_type == "Student":
-        person = next((student for student in students if str(student.student_id) == str(record_id)), None)
-        open_person_edit_dialog(parent, person, "student", students, instructors, courses, refresh_fn)
+        person = id_index["student_id"].get(str(record_id))
+        open_person_edit_dialog(parent, person, "student", students, instructors, courses, refresh_fn, id_index)
     elif record_type == "Instructor":
-        person = next((instructor for instructor in instructors if str(instructor.instructor_id) == str(record_id)), None)
-        open_person_edit_dialog(parent, person, "instructor", students, instructors, courses, refresh_fn)
+        person = id_index["instructor_id"].get(str(record_id))
+        open_person_edit_dialog(parent, person, "instructor", students, instructors, courses, refresh_fn, id_index)
     elif record_type == "Course":
-        course = next((course for course in courses if str(course.course_id) == str(record_id)), None)
-        open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn)
+        course = id_index["course_id"].get(str(record_id))
+        open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn, id_index)
 
 
-def delete_selected(tree, students, instructors, courses, refresh_fn):
+def delete_selected(tree, students, instructors, courses, refresh_fn, id_index):
     """
     Deletes the selected record after confirmation.
 
-    :param tree: The QTreeWidget with the selection.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView with the selection.
+    :type tree: QTreeView
     :param students: List of all student objects.
     :type students: list[Student]
     :param instructors: List of all instructor objects.
@@ -498,13 +509,15 @@ def delete_selected(tree, students, instructors, courses, refresh_fn):
     :type courses: list[Course]
     :param refresh_fn: Callback to refresh the main view.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
-    selection = tree.selectedItems()
-    if not selection:
+    selected = get_selected_row(tree)
+    if selected is None:
         QMessageBox.warning(tree, "No Selection", "Please select a record to delete.")
         return
 
-    record_type, record_id, *_ = get_selected_row(tree)
+    record_type, record_id, *_ = selected
 
     reply = QMessageBox.question(
         tree, "Confirm Delete",
@@ -515,30 +528,33 @@ def delete_selected(tree, students, instructors, courses, refresh_fn):
         return
 
     if record_type == "Student":
-        student = next((student for student in students if str(student.student_id) == str(record_id)), None)
+        student = id_index["student_id"].pop(str(record_id), None)
         if student:
-            # Remove from course enrollments
-            for course in courses:
-                if student in getattr(course, "enrolled_students", []):
-                    course.enrolled_students.remove(student)
+            # Remove from course enrollments; only the student's own courses can list them
+            for course_id in getattr(student, "registered_courses", []):
+                course = id_index["course_id"].get(str(course_id))
+                if course is not None:
+                    course.enrolled_students.pop(student.student_id, None)
             students.remove(student)
 
     elif record_type == "Instructor":
-        instructor = next((instructor for instructor in instructors if str(instructor.instructor_id) == str(record_id)), None)
+        instructor = id_index["instructor_id"].pop(str(record_id), None)
         if instructor:
-            # Remove instructor assignments
-            for course in courses:
-                if getattr(course, "instructor", None) is instructor:
+            # Remove instructor assignments; only the instructor's own courses can point at them
+            for course_id in getattr(instructor, "assigned_courses", ()):
+                course = id_index["course_id"].get(str(course_id))
+                if course is not None and course.instructor is instructor:
                     course.instructor = None
             instructors.remove(instructor)
 
     elif record_type == "Course":
-        course = next((course for course in courses if str(course.course_id) == str(record_id)), None)
+        course = id_index["course_id"].pop(str(record_id), None)
         if course:
-            # Remove from student/instructor lists
+            # Remove from student/instructor lists; courses loaded from JSON do not
+            # keep their enrolled students, so check every student
             for student in students:
-                if course.course_id in getattr(student, "registered_courses", []):
-                    student.registered_courses.remove(course.course_id)
+                student.registered_courses.discard(course.course_id)
+            # Courses loaded from JSON do not keep their instructor, so check every instructor
             for instructor in instructors:
                 if course.course_id in getattr(instructor, "assigned_courses", []):
                     instructor.assigned_courses.remove(course.course_id)
@@ -551,6 +567,8 @@ def save_all(students, instructors, courses):
     """
     Saves all data to their respective JSON files.
 
+    The files are written in the background and the outcome is reported when it finishes.
+
     :param students: List of student objects.
     :type students: list[Student]
     :param instructors: List of instructor objects.
@@ -558,19 +576,65 @@ def save_all(students, instructors, courses):
     :param courses: List of course objects.
     :type courses: list[Course]
     """
-    try:
-        DataManager.save_data(STUDENTS_FILE, students, "student_id")
-        DataManager.save_data(INSTRUCTORS_FILE, instructors, "instructor_id")
-        DataManager.save_data(COURSES_FILE, courses, "course_id")
-        QMessageBox.information(None, "Success", "All data has been saved.")
-    except Exception as e:
-        QMessageBox.critical(None, "Save Error", f"Failed to save data: {str(e)}")
+    # Snapshot the records on the GUI thread; merging and writing the files runs in the background
+    student_records = [student.to_dict() for student in students]
+    instructor_records = [instructor.to_dict() for instructor in instructors]
+    course_records = [course.to_dict() for course in courses]
+
+    def write_files():
+        # Each file is written by its own thread; result() re-raises the first failure
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(DataManager.save_data, STUDENTS_FILE, student_records, "student_id"),
+                executor.submit(DataManager.save_data, INSTRUCTORS_FILE, instructor_records, "instructor_id"),
+                executor.submit(DataManager.save_data, COURSES_FILE, course_records, "course_id"),
+            ]
+        for future in futures:
+            future.result()
+
+    def on_done(_, error):
+        if error is None:
+            QMessageBox.information(None, "Success", "All data has been saved.")
+        else:
+            QMessageBox.critical(None, "Save Error", f"Failed to save data: {str(error)}")
+
+    run_in_background(write_files, on_done)
+
+
+def merge_new_records(loaded, records, records_by_id, id_field):
+    """
+    Appends the loaded records whose IDs are not held yet, keeping their order.
 
+    The new IDs are found with one set difference over the ID keys, and the list
+    and index are then extended in bulk. When the loaded records repeat an ID,
+    the first one wins.
 
-def load_all(students, instructors, courses, refresh_fn):
+    :param loaded: The records read from a file.
+    :type loaded: list
+    :param records: The list of records currently held.
+    :type records: list
+    :param records_by_id: The held records keyed by ID, updated with the new ones.
+    :type records_by_id: dict[str, object]
+    :param id_field: The name of the ID attribute on the records.
+    :type id_field: str
+    """
+    get_id = attrgetter(id_field)
+    loaded_by_id = {}
+    for record in loaded:
+        loaded_by_id.setdefault(str(get_id(record)), record)
+
+    new_ids = loaded_by_id.keys() - records_by_id.keys()
+    added = {key: record for key, record in loaded_by_id.items() if key in new_ids}
+    records.extend(added.values())
+    records_by_id.update(added)
+
+
+def load_all(students, instructors, courses, refresh_fn, id_index):
     """
     Loads all data from JSON files, skipping duplicates.
 
+    The files are read in the background; the records are added once reading finishes.
+
     :param students: List to populate with student objects.
     :type students: list[Student]
     :param instructors: List to populate with instructor objects.
@@ -579,54 +643,50 @@ def load_all(students, instructors, courses, refresh_fn):
     :type courses: list[Course]
     :param refresh_fn: Callback to refresh the main view.
     :type refresh_fn: callable
-    """
-    try:
-        from student import Student
-        from instructor import Instructor
-        from course import Course
-
-        # Load data from files
-        student_data = DataManager.load_json(STUDENTS_FILE)
-        instructor_data = DataManager.load_json(INSTRUCTORS_FILE)
-        course_data = DataManager.load_json(COURSES_FILE)
-
-        # Create objects
-        loaded_students = [Student.from_dict(d) for d in student_data]
-        loaded_instructors = [Instructor.from_dict(d) for d in instructor_data]
-        loaded_courses = [Course.from_dict(d) for d in course_data]
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
+    """
+    def read_files():
+        return (DataManager.load_json(STUDENTS_FILE),
+                DataManager.load_json(INSTRUCTORS_FILE),
+                DataManager.load_json(COURSES_FILE))
+
+    def on_done(data, error):
+        # Files are read in the background; records are built and merged here on the GUI thread
+        if isinstance(error, FileNotFoundError):
+            QMessageBox.warning(None, "Files Not Found", "One or more data files could not be found.")
+            return
+        try:
+            if error is not None:
+                raise error
 
-        # Build lookup dictionaries for existing records
-        existing_students = {student.student_id for student in students}
-        existing_instructors = {instructor.instructor_id for instructor in instructors}
-        existing_courses = {course.course_id for course in courses}
+            from student import Student
+            from instructor import Instructor
+            from course import Course
 
-        # Add new records (skip duplicates)
-        for student in loaded_students:
-            if student.student_id not in existing_students:
-                students.append(student)
-                existing_students.add(student.student_id)
+            student_data, instructor_data, course_data = data
 
-        for instructor in loaded_instructors:
-            if instructor.instructor_id not in existing_instructors:
-                instructors.append(instructor)
-                existing_instructors.add(instructor.instructor_id)
+            # Create objects
+            # Rows that fail validation come back as None and are skipped
+            loaded_students = [s for s in map(Student.from_dict, student_data) if s is not None]
+            loaded_instructors = [Instructor.from_dict(d) for d in instructor_data]
+            loaded_courses = [Course.from_dict(d) for d in course_data]
 
-        for course in loaded_courses:
-            if course.course_id not in existing_courses:
-                courses.append(course)
-                existing_courses.add(course.course_id)
+            # Add new records (skip duplicates)
+            merge_new_records(loaded_students, students, id_index["student_id"], "student_id")
+            merge_new_records(loaded_instructors, instructors, id_index["instructor_id"], "instructor_id")
+            merge_new_records(loaded_courses, courses, id_index["course_id"], "course_id")
 
+            refresh_fn()
+            QMessageBox.information(None, "Success", "Data loaded successfully.")
 
-        refresh_fn()
-        QMessageBox.information(None, "Success", "Data loaded successfully.")
+        except Exception as e:
+            QMessageBox.critical(None, "Load Error", f"Failed to load data: {str(e)}")
 
-    except FileNotFoundError:
-        QMessageBox.warning(None, "Files Not Found", "One or more data files could not be found.")
-    except Exception as e:
-        QMessageBox.critical(None, "Load Error", f"Failed to load data: {str(e)}")
+    run_in_background(read_files, on_done)
 
 
-def build_records_tab(parent, students, instructors, courses, on_data_change=None):
+def build_records_tab(parent, students, instructors, courses, on_data_change=None, id_index=None):
     """
     Builds the entire records management tab for the PyQt5 UI.
 
@@ -638,11 +698,23 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
     :type instructors: list[Instructor]
     :param courses: List of course objects.
     :type courses: list[Course]
-    :param on_data_change: Optional callback for when data changes.
+    :param on_data_change: Called after an edit, delete or load changes the lists, in place of
+        refreshing the table directly, so it must also refresh the table. Defaults to None,
+        which refreshes the table only.
     :type on_data_change: callable, optional
-    :return: A tuple containing the tree widget, refresh function, and the container widget.
-    :rtype: tuple(QTreeWidget, callable, QWidget)
-    """
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field and
+        shared with the tabs that add records. Built from the lists when not given, defaults to None.
+    :type id_index: dict[str, dict[str, object]], optional
+    :return: A tuple containing the tree view, refresh function, and the container widget.
+    :rtype: tuple(QTreeView, callable, QWidget)
+    """
+    if id_index is None:
+        id_index = {
+            "student_id": {str(student.student_id): student for student in students},
+            "instructor_id": {str(instructor.instructor_id): instructor for instructor in instructors},
+            "course_id": {str(course.course_id): course for course in courses},
+        }
+
     # Search controls
     search_frame = QWidget(parent)
     search_layout = QHBoxLayout(search_frame)
@@ -684,12 +756,11 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
     action_layout.addStretch(1)
 
     # Main table
-    tree = QTreeWidget(parent)
-    tree.setColumnCount(4)
-    tree.setHeaderLabels(["Type", "ID", "Name", "Email"])
+    tree = QTreeView(parent)
+    tree.setModel(RecordsModel(["Type", "ID", "Name", "Email"], tree))
     tree.setRootIsDecorated(False)
     tree.setAlternatingRowColors(True)
-    tree.setSelectionMode(QTreeWidget.SingleSelection)
+    tree.setSelectionMode(QTreeView.SingleSelection)
     tree.setUniformRowHeights(True)
 
     tree.setColumnWidth(0, 140)  # Type
@@ -697,17 +768,29 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
     tree.setColumnWidth(2, 140)  # Name
     tree.setColumnWidth(3, 250)  # Email
 
+    # Search rows are rebuilt on the next search after any change to the records
+    search_cache = {}
+
     def refresh_function():
+        search_cache.clear()
         refresh_tree(tree, students, instructors, courses)
-        if callable(on_data_change):
-            on_data_change()
 
-    button_search.clicked.connect(lambda: apply_search(tree, query_entry, scope_combo, students, instructors, courses))
-    button_clear.clicked.connect(lambda: reset_search(query_entry, scope_combo, refresh_function))
-    button_edit.clicked.connect(lambda: edit_selected(tree, parent, students, instructors, courses, refresh_function))
-    button_delete.clicked.connect(lambda: delete_selected(tree, students, instructors, courses, refresh_function))
+    # Changes made here are reported to the rest of the UI, not just this table
+    notify_change = on_data_change if callable(on_data_change) else refresh_function
+
+    run_search, clear_search = connect_search(
+        query_entry,
+        lambda: apply_search(tree, query_entry, scope_combo, students, instructors, courses, search_cache),
+        lambda: reset_search(query_entry, scope_combo, refresh_function),
+        parent,
+    )
+
+    button_search.clicked.connect(run_search)
+    button_clear.clicked.connect(clear_search)
+    button_edit.clicked.connect(lambda: edit_selected(tree, parent, students, instructors, courses, notify_change, id_index))
+    button_delete.clicked.connect(lambda: delete_selected(tree, students, instructors, courses, notify_change, id_index))
     button_save_all.clicked.connect(lambda: save_all(students, instructors, courses))
-    button_load_all.clicked.connect(lambda: load_all(students, instructors, courses, refresh_function))
+    button_load_all.clicked.connect(lambda: load_all(students, instructors, courses, notify_change, id_index))
     button_export.clicked.connect(lambda: export_to_csv(tree))
 
     container = QWidget(parent)
@@ -717,6 +800,4 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
     container_layout.addWidget(action_frame)
     container_layout.addWidget(tree)
 
-    tree._on_data_change = on_data_change
-
     return tree, refresh_function, container 
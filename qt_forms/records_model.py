@@ -0,0 +1,121 @@
+"""
+This module provides the table model behind the PyQt5 records view.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class RecordsModel(QAbstractTableModel):
+    """
+    A read-only table model that stores its rows as one list per column.
+
+    A QTreeView over this model creates no per-cell objects; it asks for the
+    text of a cell only when that cell is painted, so filling or scrolling a
+    large table only formats the rows on screen.
+
+    :param headers: The column titles, one per column.
+    :type headers: list[str]
+    :param parent: The Qt object that owns the model, defaults to None.
+    :type parent: QObject, optional
+    """
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._cols = [[] for _ in self._headers]
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Returns the number of rows.
+
+        :param parent: The parent index; table models only have a root.
+        :type parent: QModelIndex
+        :return: The number of rows.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self._cols[0])
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Returns the number of columns.
+
+        :param parent: The parent index; table models only have a root.
+        :type parent: QModelIndex
+        :return: The number of columns.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Returns the text of the cell at the given index.
+
+        :param index: The index of the requested cell.
+        :type index: QModelIndex
+        :param role: The requested data role.
+        :type role: int
+        :return: The cell text, or None for other roles and invalid indexes.
+        :rtype: str or None
+        """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cols[index.column()][index.row()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Returns the column titles for the horizontal header.
+
+        :param section: The column number.
+        :type section: int
+        :param orientation: The header orientation.
+        :type orientation: Qt.Orientation
+        :param role: The requested data role.
+        :type role: int
+        :return: The column title, or None for other headers and roles.
+        :rtype: str or None
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def set_rows(self, rows):
+        """
+        Replaces all rows.
+
+        The cells are shown as given, so producers format them as strings.
+
+        :param rows: The row tuples to show, in display order, one string per column.
+        :type rows: iterable[tuple[str, ...]]
+        """
+        rows = list(rows)
+        self.beginResetModel()
+        self._cols = [list(col) for col in zip(*rows)] if rows else [[] for _ in self._headers]
+        self.endResetModel()
+
+    def headers(self):
+        """
+        Returns the column titles.
+
+        :return: The column titles.
+        :rtype: list[str]
+        """
+        return list(self._headers)
+
+    def row(self, row):
+        """
+        Returns the cells of one row.
+
+        :param row: The row number.
+        :type row: int
+        :return: The cell texts of the row.
+        :rtype: tuple[str, ...]
+        """
+        return tuple(col[row] for col in self._cols)
+
+    def rows(self):
+        """
+        Returns all rows in display order.
+
+        :return: The cell texts of every row.
+        :rtype: list[tuple[str, ...]]
+        """
+        return list(zip(*self._cols))
@@ -9,8 +9,9 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QGroupBox, QLabel, QComboBox, QPushButton, QMessageBox, QGridLayout
 )
+from qt_forms.combo_helpers import ObjectListModel
 
-def build_registration_tab(parent, students, courses, refresh_cb):
+def build_registration_tab(parent, students, courses, refresh_cb, course_model=None):
     """
     Builds the 'Student Registration' tab for the PyQt5 UI.
 
@@ -22,6 +23,9 @@ def build_registration_tab(parent, students, courses, refresh_cb):
     :type courses: list[Course]
     :param refresh_cb: A callback function to refresh the main application's data view.
     :type refresh_cb: callable
+    :param course_model: A course list model shared with other tabs, defaults to None.
+                         A private model is created when omitted.
+    :type course_model: ObjectListModel, optional
     :return: The group box containing the registration UI. It includes a 'refresh_boxes'
              method to allow external updates to the dropdowns.
     :rtype: QGroupBox
@@ -40,13 +44,16 @@ def build_registration_tab(parent, students, courses, refresh_cb):
     student_box = QComboBox(frame)
     student_box.setEditable(False) 
     student_box.setMinimumContentsLength(40)
-    student_box.addItems([s.display_student() for s in students])
+    student_model = ObjectListModel(students, lambda student: student.display_student(), frame)
+    student_box.setModel(student_model)
     layout.addWidget(student_box, 0, 1)
 
     course_box = QComboBox(frame)
     course_box.setEditable(False)
     course_box.setMinimumContentsLength(40)
-    course_box.addItems([c.display_course() for c in courses])
+    if course_model is None:
+        course_model = ObjectListModel(courses, lambda course: course.display_course(), frame)
+    course_box.setModel(course_model)
     layout.addWidget(course_box, 1, 1)
 
     def refresh_boxes():
@@ -56,11 +63,8 @@ def build_registration_tab(parent, students, courses, refresh_cb):
         student_box.blockSignals(True)
         course_box.blockSignals(True)
 
-        student_box.clear()
-        student_box.addItems([student.display_student() for student in students])
-
-        course_box.clear()
-        course_box.addItems([course.display_course() for course in courses])
+        student_model.refresh()
+        course_model.refresh()
 
         student_box.setCurrentIndex(-1)
         course_box.setCurrentIndex(-1)
@@ -84,8 +88,7 @@ def build_registration_tab(parent, students, courses, refresh_cb):
         selected_course  = courses[course_index]
 
         # prevent duplicates
-        if any(registered_course == selected_course.course_id
-               for registered_course in getattr(selected_student, "registered_courses", [])):
+        if selected_course.course_id in selected_student.registered_courses:
             QMessageBox.information(frame, "Already registered",
                                     f"{selected_student.name} is already in {selected_course.course_id}.")
             return
@@ -0,0 +1,57 @@
+"""
+This module provides the search helpers shared by the PyQt5 records tabs.
+"""
+from PyQt5.QtCore import QTimer
+
+# Search scope of each record type
+SCOPES = {"Student": "Students", "Instructor": "Instructors", "Course": "Courses"}
+
+
+def build_search_index(rows):
+    """
+    Builds the entries searched by the records tabs from their display rows.
+
+    Each entry pairs a row with its search scope and its ID, name and email
+    lowercased into one string, so a search only needs a single substring
+    test per row. Newlines separate the fields, so a query never matches
+    across two of them.
+
+    :param rows: (type, ID, name, email) display rows.
+    :type rows: iterable[tuple[str, str, str, str]]
+    :return: (scope, row, haystack) entries in display order.
+    :rtype: list[tuple(str, tuple, str)]
+    """
+    return [(SCOPES[row[0]], row, f"{row[1]}\n{row[2]}\n{row[3]}".lower()) for row in rows]
+
+
+def connect_search(query_entry, search, reset, parent):
+    """
+    Runs a search as the user types, once typing pauses for 150 ms.
+
+    :param query_entry: The QLineEdit with the search query.
+    :type query_entry: QLineEdit
+    :param search: Filters the view by the current query.
+    :type search: callable
+    :param reset: Clears the search fields and shows every record.
+    :type reset: callable
+    :param parent: The Qt object that owns the timer.
+    :type parent: QObject
+    :return: The handlers for the search and clear buttons.
+    :rtype: tuple(callable, callable)
+    """
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(150)
+
+    def run_search():
+        timer.stop()
+        search()
+
+    def clear_search():
+        reset()
+        # Clearing the query restarted the timer, but the view is already reset
+        timer.stop()
+
+    timer.timeout.connect(run_search)
+    query_entry.textChanged.connect(lambda _text: timer.start())
+    return run_search, clear_search
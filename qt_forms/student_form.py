@@ -6,17 +6,16 @@ Input validation is performed before adding the student to the data source.
 """
 
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QLineEdit, QPushButton, QMessageBox,
-    QGridLayout
+    QGroupBox, QPushButton, QMessageBox
 )
 
 from student import Student
 from validators import validate_name, validate_age, require, validate_email, validate_unique_id
+from qt_forms.form_helpers import STUDENT_FIELDS, add_button_row, build_field_form
 
 
-def build_student_tab(parent: QtWidgets.QWidget, students: list, refresh_cb):
+def build_student_tab(parent: QtWidgets.QWidget, students: list, refresh_cb, students_by_id=None):
     """
     Builds the 'Add Student' tab for the PyQt5 application.
 
@@ -31,36 +30,28 @@ def build_student_tab(parent: QtWidgets.QWidget, students: list, refresh_cb):
     :param refresh_cb: A callback function to be called after a student is successfully added,
                        to refresh the display of student records.
     :type refresh_cb: function
+    :param students_by_id: The students in the list keyed by ID, shared with other tabs that
+                           change it. Built from the list when not given, defaults to None.
+    :type students_by_id: dict, optional
     :return: A QGroupBox widget containing the student form.
     :rtype: QGroupBox
     """
+    if students_by_id is None:
+        students_by_id = {str(student.student_id): student for student in students}
+
     frame = QGroupBox("Add Student", parent)
 
-    layout = QGridLayout(frame)
-    layout.setContentsMargins(10, 10, 10, 10)
+    layout, inputs = build_field_form(frame, STUDENT_FIELDS)
     layout.setHorizontalSpacing(8)
     layout.setVerticalSpacing(8)
-
-    # Labels
-    layout.addWidget(QLabel("Name:"),      0, 0)
-    layout.addWidget(QLabel("Age:"),       1, 0)
-    layout.addWidget(QLabel("Email:"),     2, 0)
-    layout.addWidget(QLabel("Student ID:"),3, 0)
-
-    # Inputs
-    name_input  = QLineEdit(frame)
-    age_input   = QLineEdit(frame)
-    email_input = QLineEdit(frame)
-    id_input    = QLineEdit(frame)
-
-    layout.addWidget(name_input,  0, 1)
-    layout.addWidget(age_input,   1, 1)
-    layout.addWidget(email_input, 2, 1)
-    layout.addWidget(id_input,    3, 1)
+    name_input  = inputs["name"]
+    age_input   = inputs["age"]
+    email_input = inputs["email"]
+    id_input    = inputs["id"]
 
     # Button
     add_button = QPushButton("Add Student", frame)
-    layout.addWidget(add_button, 4, 1, alignment=Qt.AlignRight)
+    add_button_row(layout, add_button)
 
     def add_student():
         """
@@ -80,11 +71,12 @@ def build_student_tab(parent: QtWidgets.QWidget, students: list, refresh_cb):
             return
 
         # unique ID check
-        if not validate_unique_id(sid, students, "student_id"):
+        if not validate_unique_id(sid, students_by_id, "student_id"):
             return
 
         student = Student(name=name, age=age, email=email, student_id=sid)
         students.append(student)
+        students_by_id[sid] = student
 
         QMessageBox.information(frame, "Success", "Student Added!")
 
@@ -7,8 +7,9 @@ It allows assigning an instructor to a course, with data being persisted via a d
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QComboBox, QPushButton, QMessageBox, QGridLayout
+    QGroupBox, QLabel, QPushButton, QMessageBox, QGridLayout
 )
+from qt_forms.combo_helpers import LazyComboBox, set_object_items
 
 def build_assignment_tab(parent, db_manager, refresh_cb):
     """
@@ -36,44 +37,44 @@ def build_assignment_tab(parent, db_manager, refresh_cb):
     layout.addWidget(QLabel("Instructor:", frame), 0, 0)
     layout.addWidget(QLabel("Course:", frame), 1, 0)
 
-    instructor_box = QComboBox(frame)
+    def load_instructors(box):
+        """
+        Fills the instructor dropdown with the latest instructors from the database.
+
+        :param box: The instructor dropdown.
+        :type box: LazyComboBox
+        """
+        set_object_items(box, db_manager.get_all_instructors(), lambda instructor: instructor.display_instructor())
+
+    def load_courses(box):
+        """
+        Fills the course dropdown with the latest courses from the database.
+
+        :param box: The course dropdown.
+        :type box: LazyComboBox
+        """
+        set_object_items(box, db_manager.get_all_courses(), lambda course: course.display_course())
+
+    instructor_box = LazyComboBox(load_instructors, frame)
     instructor_box.setEditable(False)
     instructor_box.setMinimumContentsLength(40)
     layout.addWidget(instructor_box, 0, 1)
 
-    course_box = QComboBox(frame)
+    course_box = LazyComboBox(load_courses, frame)
     course_box.setEditable(False)
     course_box.setMinimumContentsLength(40)
     layout.addWidget(course_box, 1, 1)
 
     def refresh_boxes():
         """
-        Refreshes the contents of the instructor and course dropdown boxes.
+        Marks the instructor and course dropdowns as out of date and clears their selection.
 
-        Fetches the latest lists of instructors and courses from the database
-        and populates the dropdowns.
+        The dropdowns fetch the latest lists from the database the next time
+        they are opened.
         """
-        instructors = db_manager.get_all_instructors()
-        courses = db_manager.get_all_courses()
-
-        instructor_box.blockSignals(True)
-        course_box.blockSignals(True)
-
-        instructor_box.clear()
-        instructor_box.addItems([instructor.display_instructor() for instructor in instructors])
-
-        course_box.clear()
-        course_box.addItems([course.display_course() for course in courses])
-
-        instructor_box.setCurrentIndex(-1)
-        course_box.setCurrentIndex(-1)
-
-        instructor_box.blockSignals(False)
-        course_box.blockSignals(False)
-
-        # Store the current lists for later reference
-        frame.current_instructors = instructors
-        frame.current_courses = courses
+        for box in (instructor_box, course_box):
+            box.invalidate()
+            box.setCurrentIndex(-1)
 
     def assign_instructor():
         """
@@ -82,16 +83,13 @@ def build_assignment_tab(parent, db_manager, refresh_cb):
         Assigns the selected instructor to the selected course and saves the
         assignment to the database. Shows a success or error message.
         """
-        instructor_index = instructor_box.currentIndex()
-        course_index = course_box.currentIndex()
+        selected_instructor = instructor_box.currentData(Qt.UserRole)
+        selected_course = course_box.currentData(Qt.UserRole)
 
-        if instructor_index == -1 or course_index == -1:
+        if selected_instructor is None or selected_course is None:
             QMessageBox.warning(frame, "Select both", "Please select an instructor and a course.")
             return
 
-        selected_instructor = frame.current_instructors[instructor_index]
-        selected_course = frame.current_courses[course_index]
-
         try:
             db_manager.assign_instructor_course(selected_instructor.instructor_id, selected_course.course_id)
             QMessageBox.information(
@@ -107,8 +105,5 @@ def build_assignment_tab(parent, db_manager, refresh_cb):
     assign_button.clicked.connect(assign_instructor)
     layout.addWidget(assign_button, 2, 1, alignment=Qt.AlignRight)
 
-    # Initial load of the boxes
-    refresh_boxes()
-
     frame.refresh_boxes = refresh_boxes
     return frame
\ No newline at end of file
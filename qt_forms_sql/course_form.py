@@ -6,12 +6,12 @@ Input validation is performed, and the new course is persisted to the database.
 """
 
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QLineEdit, QPushButton, QMessageBox, QGridLayout
+    QGroupBox, QPushButton, QMessageBox
 )
 from course import Course
 from validators import require
+from qt_forms.form_helpers import COURSE_FIELDS, add_button_row, build_field_form
 
 def build_course_tab(parent, db_manager, refresh_cb):
     """
@@ -33,18 +33,9 @@ def build_course_tab(parent, db_manager, refresh_cb):
     """
     frame = QGroupBox("Add Course", parent)
 
-    layout = QGridLayout(frame)
-    layout.setContentsMargins(10, 10, 10, 10)
-
-    # Labels
-    layout.addWidget(QLabel("Course ID:", frame), 0, 0)
-    layout.addWidget(QLabel("Course Name:", frame), 1, 0)
-
-    id_input = QLineEdit(frame)
-    name_input = QLineEdit(frame)
-
-    layout.addWidget(id_input, 0, 1)
-    layout.addWidget(name_input, 1, 1)
+    layout, inputs = build_field_form(frame, COURSE_FIELDS)
+    id_input = inputs["id"]
+    name_input = inputs["name"]
 
     def add_course():
         """
@@ -75,6 +66,6 @@ def build_course_tab(parent, db_manager, refresh_cb):
 
     add_button = QPushButton("Add Course", frame)
     add_button.clicked.connect(add_course)
-    layout.addWidget(add_button, 3, 1, alignment=Qt.AlignRight)
+    add_button_row(layout, add_button)
 
     return frame
\ No newline at end of file
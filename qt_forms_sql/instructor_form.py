@@ -6,12 +6,12 @@ Input validation is performed, and the new instructor is persisted to the databa
 """
 
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QLineEdit, QPushButton, QMessageBox, QGridLayout
+    QGroupBox, QPushButton, QMessageBox
 )
 from instructor import Instructor
 from validators import validate_name, validate_age, validate_email, require
+from qt_forms.form_helpers import INSTRUCTOR_FIELDS, add_button_row, build_field_form
 
 def build_instructor_tab(parent, db_manager, refresh_cb):
     """
@@ -33,23 +33,11 @@ def build_instructor_tab(parent, db_manager, refresh_cb):
     """
     frame = QGroupBox("Add Instructor", parent)
 
-    layout = QGridLayout(frame)
-    layout.setContentsMargins(10, 10, 10, 10)
-
-    layout.addWidget(QLabel("Name:", frame), 0, 0)
-    layout.addWidget(QLabel("Age:", frame), 1, 0)
-    layout.addWidget(QLabel("Email:", frame), 2, 0)
-    layout.addWidget(QLabel("Instructor ID:", frame), 3, 0)
-
-    name_input = QLineEdit(frame)
-    age_input = QLineEdit(frame)
-    email_input = QLineEdit(frame)
-    id_input = QLineEdit(frame)
-
-    layout.addWidget(name_input, 0, 1)
-    layout.addWidget(age_input, 1, 1)
-    layout.addWidget(email_input, 2, 1)
-    layout.addWidget(id_input, 3, 1)
+    layout, inputs = build_field_form(frame, INSTRUCTOR_FIELDS)
+    name_input = inputs["name"]
+    age_input = inputs["age"]
+    email_input = inputs["email"]
+    id_input = inputs["id"]
 
     def add_instructor():
         """
@@ -64,9 +52,9 @@ def build_instructor_tab(parent, db_manager, refresh_cb):
         email = email_input.text().strip()
         instructor_id = id_input.text().strip()
 
-        # validate inputs
+        # Each validator also rejects an empty value, so only the ID needs require
         if not (validate_name(name) and validate_age(age) and validate_email(email)
-                and require(instructor_id, "Instructor ID") and require(name, "Name") and require(email, "Email") and require(age, "Age")):
+                and require(instructor_id, "Instructor ID")):
             return
 
         try:
@@ -74,10 +62,8 @@ def build_instructor_tab(parent, db_manager, refresh_cb):
             db_manager.add_instructor(instructor)
             QMessageBox.information(frame, "Success", "Instructor Added!")
 
-            name_input.clear()
-            age_input.clear()
-            email_input.clear()
-            id_input.clear()
+            for field in inputs.values():
+                field.clear()
 
             refresh_cb()
         except ValueError as e:
@@ -85,6 +71,6 @@ def build_instructor_tab(parent, db_manager, refresh_cb):
 
     add_button = QPushButton("Add Instructor", frame)
     add_button.clicked.connect(add_instructor)
-    layout.addWidget(add_button, 4, 1, alignment=Qt.AlignRight)
+    add_button_row(layout, add_button)
 
     return frame
\ No newline at end of file
@@ -9,150 +9,111 @@ a backup of the database.
 from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import (
     QComboBox, QDialog, QFileDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit,
-    QMessageBox, QPushButton, QTreeWidget, QTreeWidgetItem, QVBoxLayout, QWidget
+    QMessageBox, QPushButton, QTreeView, QVBoxLayout, QWidget
 )
 import csv
 from datetime import datetime
+from qt_forms.background import run_in_background
+from qt_forms.records_model import RecordsModel
+from qt_forms.search_helpers import build_search_index, connect_search
 
-def student_row(student):
+class _RecordsWidget(QWidget):
     """
-    Formats a student object into a tuple for display in the records tree.
+    The Records tab's main widget; it defers refreshes while it is hidden.
 
-    :param student: The student object.
-    :type student: Student
-    :return: A tuple containing the student's details.
-    :rtype: tuple
-    """
-    return ("Student", student.student_id, student.name, student.get_email())
-
-def instructor_row(instructor):
-    """
-    Formats an instructor object into a tuple for display in the records tree.
-
-    :param instructor: The instructor object.
-    :type instructor: Instructor
-    :return: A tuple containing the instructor's details.
-    :rtype: tuple
-    """
-    return ("Instructor", instructor.instructor_id, instructor.name, instructor.get_email())
-
-def course_row(course):
+    :param parent: The parent widget.
+    :type parent: QWidget
     """
-    Formats a course object into a tuple for display in the records tree.
 
-    :param course: The course object.
-    :type course: Course
-    :return: A tuple containing the course's details.
-    :rtype: tuple
-    """
-    return ("Course", course.course_id, course.course_name, "-")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Reloads the rows; set once the view is built
+        self.load = None
+        self._dirty = False
+
+    def refresh_records(self):
+        """
+        Reloads the rows now if the tab is visible, otherwise the next time it is shown.
+        """
+        if self.isVisible():
+            self._dirty = False
+            self.load()
+        else:
+            self._dirty = True
 
-def insert_row(tree, row):
-    """
-    Inserts a new row into the specified QTreeWidget.
+    def showEvent(self, event):
+        """
+        Runs the refresh that was deferred while the tab was hidden, if any.
 
-    :param tree: The QTreeWidget to insert the row into.
-    :type tree: QTreeWidget
-    :param row: A tuple or list of data for the row.
-    :type row: tuple or list
-    """
-    item = QTreeWidgetItem([str(x) if x is not None else "" for x in row])
-    tree.addTopLevelItem(item)
+        :param event: The show event.
+        :type event: QShowEvent
+        """
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.load()
 
 def fill_tree(tree, db_manager):
     """
-    Populates the QTreeWidget with all records from the database.
+    Shows all records from the database in the QTreeView.
 
-    :param tree: The QTreeWidget to populate.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to populate.
+    :type tree: QTreeView
     :param db_manager: The database manager instance.
     :type db_manager: DatabaseManager
     """
-    students = db_manager.get_all_students()
-    instructors = db_manager.get_all_instructors()
-    courses = db_manager.get_all_courses()
-
-    for student in students:
-        insert_row(tree, student_row(student))
-    for instructor in instructors:
-        insert_row(tree, instructor_row(instructor))
-    for course in courses:
-        insert_row(tree, course_row(course))
+    tree.model().set_rows(db_manager.get_all_records())
 
 def refresh_tree(tree, db_manager):
     """
-    Clears and refills the QTreeWidget with fresh data from the database.
+    Replaces the rows of the QTreeView with fresh data from the database.
 
-    :param tree: The QTreeWidget to refresh.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to refresh.
+    :type tree: QTreeView
     :param db_manager: The database manager instance.
     :type db_manager: DatabaseManager
     """
-    tree.clear()
     fill_tree(tree, db_manager)
 
-def apply_search(tree, query_entry, scope_combo, db_manager):
+def apply_search(tree, query_entry, scope_combo, db_manager, search_cache=None):
     """
     Filters the records in the tree based on a search query and scope.
 
-    :param tree: The QTreeWidget to apply the search to.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView to apply the search to.
+    :type tree: QTreeView
     :param query_entry: The QLineEdit widget containing the search query.
     :type query_entry: QLineEdit
     :param scope_combo: The QComboBox widget for the search scope.
     :type scope_combo: QComboBox
     :param db_manager: The database manager instance.
     :type db_manager: DatabaseManager
+    :param search_cache: Holds the search index between searches; the owner clears it whenever
+        the records change. A fresh index is built when not given, defaults to None.
+    :type search_cache: dict, optional
     """
     search_input = query_entry.text().strip().lower()
     scope = scope_combo.currentText()
-    tree.clear()
-
-    # Get fresh data
-    students = []
-    instructors = []
-    courses = []
-
-    if scope in ("All", "Students"):
-        students = db_manager.get_all_students()
-    if scope in ("All", "Instructors"):
-        instructors = db_manager.get_all_instructors()
-    if scope in ("All", "Courses"):
-        courses = db_manager.get_all_courses()
-
-    if not search_input:
-        # Show everything if no search query
-        for student in students:
-            insert_row(tree, student_row(student))
-        for instructor in instructors:
-            insert_row(tree, instructor_row(instructor))
-        for course in courses:
-            insert_row(tree, course_row(course))
-        return
-
-    def record_matches(row):
-        record_type, record_id, name, email = row
-        return any(search_input in str(val).lower() for val in (record_id, name, email))
 
-    # Build filtered results
-    rows = []
-    rows.extend(student_row(s) for s in students)
-    rows.extend(instructor_row(i) for i in instructors)
-    rows.extend(course_row(c) for c in courses)
+    # The rows are loaded once and filtered in memory until the records change
+    if search_cache is None:
+        search_cache = {}
+    index = search_cache.get("index")
+    if index is None:
+        index = search_cache["index"] = build_search_index(db_manager.get_all_records())
 
-    for row in rows:
-        if record_matches(row):
-            insert_row(tree, row)
+    any_scope = scope == "All"
+    tree.model().set_rows(row for entry_scope, row, haystack in index
+                          if (any_scope or entry_scope == scope) and search_input in haystack)
 
 def export_to_csv(tree):
     """
-    Exports the currently displayed records in the QTreeWidget to a CSV file.
+    Exports the currently displayed records in the QTreeView to a CSV file.
 
-    :param tree: The QTreeWidget containing the records to export.
-    :type tree: QTreeWidget
+    :param tree: The QTreeView containing the records to export.
+    :type tree: QTreeView
     """
-    top_count = tree.topLevelItemCount()
-    if top_count == 0:
+    model = tree.model()
+    if model.rowCount() == 0:
         QMessageBox.warning(tree, "Export Warning", "No records to export!")
         return
 
@@ -167,18 +128,14 @@ def export_to_csv(tree):
         return
 
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
 
             # Write headers
-            headers = [tree.headerItem().text(col) for col in range(tree.columnCount())]
-            writer.writerow(headers)
+            writer.writerow(model.headers())
 
             # Write data
-            for i in range(top_count):
-                item = tree.topLevelItem(i)
-                row = [item.text(col) for col in range(tree.columnCount())]
-                writer.writerow(row)
+            writer.writerows(model.rows())
 
         QMessageBox.information(tree, "Export Successful",
                               f"Records have been exported to {filename}")
@@ -210,14 +167,20 @@ def create_backup_dialog(parent, db_manager):
     button_layout = QHBoxLayout(button_frame)
     button_layout.addStretch(1)
 
-    def create_backup():
-        success, message = db_manager.backup_database()
+    def on_backup_done(result, error):
+        backup_button.setEnabled(True)
+        success, message = result if error is None else (False, f"Backup failed: {str(error)}")
         if success:
             QMessageBox.information(dialog, "Backup Success", message)
             dialog.accept()
         else:
             QMessageBox.critical(dialog, "Backup Failed", message)
 
+    def create_backup():
+        # The copy runs in the background; the button stays disabled until it reports back
+        backup_button.setEnabled(False)
+        run_in_background(db_manager.backup_database, on_backup_done)
+
     backup_button = QPushButton("Create Backup", button_frame)
     backup_button.clicked.connect(create_backup)
     cancel_button = QPushButton("Cancel", button_frame)
@@ -255,7 +218,7 @@ def build_records_tab(parent, db_manager):
     :return: The main widget for the 'Records' tab.
     :rtype: QWidget
     """
-    main_widget = QWidget(parent)
+    main_widget = _RecordsWidget(parent)
     layout = QVBoxLayout(main_widget)
     layout.setContentsMargins(10, 10, 10, 10)
 
@@ -275,9 +238,11 @@ def build_records_tab(parent, db_manager):
 
     layout.addWidget(search_frame)
 
-    # Tree widget
-    tree = QTreeWidget(main_widget)
-    tree.setHeaderLabels(["Type", "ID", "Name", "Email"])
+    # Tree view
+    tree = QTreeView(main_widget)
+    tree.setModel(RecordsModel(["Type", "ID", "Name", "Email"], tree))
+    tree.setRootIsDecorated(False)
+    tree.setUniformRowHeights(True)
     tree.setColumnWidth(0, 100)
     tree.setColumnWidth(1, 100)
     tree.setColumnWidth(2, 200)
@@ -289,20 +254,38 @@ def build_records_tab(parent, db_manager):
     button_layout = QHBoxLayout(button_frame)
     button_layout.setContentsMargins(0, 0, 0, 0)
 
+    # Search rows are rebuilt on the next search after any change to the records
+    search_cache = {}
+
     def refresh_records():
+        search_cache.clear()
         refresh_tree(tree, db_manager)
 
+    main_widget.load = refresh_records
+
+    run_search, clear_search = connect_search(
+        query_entry,
+        lambda: apply_search(tree, query_entry, scope_combo, db_manager, search_cache),
+        lambda: reset_search(query_entry, scope_combo, refresh_records),
+        main_widget,
+    )
+
     # Search buttons
     search_button = QPushButton("Search", search_frame)
-    search_button.clicked.connect(lambda: apply_search(tree, query_entry, scope_combo, db_manager))
+    search_button.clicked.connect(run_search)
     search_layout.addWidget(search_button)
 
     reset_button = QPushButton("Clear", search_frame)
-    reset_button.clicked.connect(lambda: reset_search(query_entry, scope_combo, refresh_records))
+    reset_button.clicked.connect(clear_search)
     search_layout.addWidget(reset_button)
 
     refresh_button = QPushButton("Refresh", search_frame)
-    refresh_button.clicked.connect(refresh_records)
+    def reload_records():
+        # Another process may have changed the database, so the cached rows are dropped too
+        db_manager.invalidate_all()
+        refresh_records()
+
+    refresh_button.clicked.connect(reload_records)
     search_layout.addWidget(refresh_button)
 
     # Export and backup buttons
@@ -317,7 +300,7 @@ def build_records_tab(parent, db_manager):
     button_layout.addStretch(1)
     layout.addWidget(button_frame)
 
-    # Initial load
-    fill_tree(tree, db_manager)
+    # Initial load, deferred until the tab is first shown
+    main_widget.refresh_records()
 
     return main_widget
\ No newline at end of file
@@ -7,8 +7,9 @@ It allows registering a student for a course, with data being persisted via a da
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QComboBox, QPushButton, QMessageBox, QGridLayout
+    QGroupBox, QLabel, QPushButton, QMessageBox, QGridLayout
 )
+from qt_forms.combo_helpers import LazyComboBox, set_object_items
 
 
 def build_registration_tab(parent, db_manager, refresh_cb):
@@ -36,44 +37,44 @@ def build_registration_tab(parent, db_manager, refresh_cb):
     layout.addWidget(QLabel("Student:", frame), 0, 0)
     layout.addWidget(QLabel("Course:", frame), 1, 0)
 
-    student_box = QComboBox(frame)
+    def load_students(box):
+        """
+        Fills the student dropdown with the latest students from the database.
+
+        :param box: The student dropdown.
+        :type box: LazyComboBox
+        """
+        set_object_items(box, db_manager.get_all_students(), lambda student: student.display_student())
+
+    def load_courses(box):
+        """
+        Fills the course dropdown with the latest courses from the database.
+
+        :param box: The course dropdown.
+        :type box: LazyComboBox
+        """
+        set_object_items(box, db_manager.get_all_courses(), lambda course: course.display_course())
+
+    student_box = LazyComboBox(load_students, frame)
     student_box.setEditable(False) 
     student_box.setMinimumContentsLength(40)
     layout.addWidget(student_box, 0, 1)
 
-    course_box = QComboBox(frame)
+    course_box = LazyComboBox(load_courses, frame)
     course_box.setEditable(False)
     course_box.setMinimumContentsLength(40)
     layout.addWidget(course_box, 1, 1)
 
     def refresh_boxes():
         """
-        Refreshes the contents of the student and course dropdown boxes.
+        Marks the student and course dropdowns as out of date and clears their selection.
 
-        Fetches the latest lists of students and courses from the database
-        and populates the dropdowns.
+        The dropdowns fetch the latest lists from the database the next time
+        they are opened.
         """
-        students = db_manager.get_all_students()
-        courses = db_manager.get_all_courses()
-
-        student_box.blockSignals(True)
-        course_box.blockSignals(True)
-
-        student_box.clear()
-        student_box.addItems([student.display_student() for student in students])
-
-        course_box.clear()
-        course_box.addItems([course.display_course() for course in courses])
-
-        student_box.setCurrentIndex(-1)
-        course_box.setCurrentIndex(-1)
-
-        student_box.blockSignals(False)
-        course_box.blockSignals(False)
-
-        # Store the current lists for later reference
-        frame.current_students = students
-        frame.current_courses = courses
+        for box in (student_box, course_box):
+            box.invalidate()
+            box.setCurrentIndex(-1)
 
     def register_student():
         """
@@ -82,16 +83,13 @@ def build_registration_tab(parent, db_manager, refresh_cb):
         Registers the selected student for the selected course and saves the
         registration to the database. Shows a success or error message.
         """
-        student_index = student_box.currentIndex()
-        course_index = course_box.currentIndex()
+        selected_student = student_box.currentData(Qt.UserRole)
+        selected_course = course_box.currentData(Qt.UserRole)
 
-        if student_index == -1 or course_index == -1:
+        if selected_student is None or selected_course is None:
             QMessageBox.warning(frame, "Select both", "Please select a student and a course.")
             return
 
-        selected_student = frame.current_students[student_index]
-        selected_course = frame.current_courses[course_index]
-
         try:
             db_manager.register_student_course(selected_student.student_id, selected_course.course_id)
             QMessageBox.information(
@@ -2,18 +2,19 @@
 This module provides a function to build the 'Add Student' tab for the PyQt5-based GUI.
 
 It includes a form for adding a new student with fields for name, age, email, and student ID.
-Input validation is performed, and the new student is persisted to the database.
+Input validation is performed, and the new student is persisted to the database
+off the GUI thread.
 """
 
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
-    QGroupBox, QLabel, QLineEdit, QPushButton, QMessageBox,
-    QGridLayout
+    QGroupBox, QPushButton, QMessageBox
 )
 
 from student import Student
 from validators import validate_name, validate_age, require, validate_email
+from qt_forms.background import run_in_background
+from qt_forms.form_helpers import STUDENT_FIELDS, add_button_row, build_field_form
 
 def build_student_tab(parent: QtWidgets.QWidget, db_manager, refresh_cb):
     """
@@ -35,39 +36,37 @@ def build_student_tab(parent: QtWidgets.QWidget, db_manager, refresh_cb):
     """
     frame = QGroupBox("Add Student", parent)
 
-    layout = QGridLayout(frame)
-    layout.setContentsMargins(10, 10, 10, 10)
+    layout, inputs = build_field_form(frame, STUDENT_FIELDS)
     layout.setHorizontalSpacing(8)
     layout.setVerticalSpacing(8)
-
-    # Labels
-    layout.addWidget(QLabel("Name:"),      0, 0)
-    layout.addWidget(QLabel("Age:"),       1, 0)
-    layout.addWidget(QLabel("Email:"),     2, 0)
-    layout.addWidget(QLabel("Student ID:"),3, 0)
-
-    # Inputs
-    name_input  = QLineEdit(frame)
-    age_input   = QLineEdit(frame)
-    email_input = QLineEdit(frame)
-    id_input    = QLineEdit(frame)
-
-    layout.addWidget(name_input,  0, 1)
-    layout.addWidget(age_input,   1, 1)
-    layout.addWidget(email_input, 2, 1)
-    layout.addWidget(id_input,    3, 1)
+    name_input  = inputs["name"]
+    age_input   = inputs["age"]
+    email_input = inputs["email"]
+    id_input    = inputs["id"]
 
     # Button
     add_button = QPushButton("Add Student", frame)
-    layout.addWidget(add_button, 4, 1, alignment=Qt.AlignRight)
+    add_button_row(layout, add_button)
+
+    def on_add_done(result, error):
+        add_button.setEnabled(True)
+        if error is not None:
+            QMessageBox.warning(frame, "Error", str(error))
+            return
+
+        QMessageBox.information(frame, "Success", "Student Added!")
+        for field in inputs.values():
+            field.clear()
+        refresh_cb()
 
     def add_student():
         """
         Handles the 'Add Student' button click event.
 
         Retrieves user input, validates it, creates a new Student object,
-        and adds it to the database. Shows a success or error message
-        and clears the input fields. Finally, it calls the refresh callback.
+        and adds it to the database on a background thread. When the insert
+        reports back, shows a success or error message, clears the input
+        fields and calls the refresh callback.
         """
         name  = name_input.text().strip()
         age   = age_input.text().strip()
@@ -81,17 +80,13 @@ def build_student_tab(parent: QtWidgets.QWidget, db_manager, refresh_cb):
 
         try:
             student = Student(name=name, age=age, email=email, student_id=sid)
-            db_manager.add_student(student)
-            QMessageBox.information(frame, "Success", "Student Added!")
-
-            name_input.clear()
-            age_input.clear()
-            email_input.clear()
-            id_input.clear()
-
-            refresh_cb()
         except ValueError as e:
             QMessageBox.warning(frame, "Error", str(e))
+            return
+
+        # The commit runs in the background; the button stays disabled until it reports back
+        add_button.setEnabled(False)
+        run_in_background(lambda: db_manager.add_student(student), on_add_done)
 
     add_button.clicked.connect(add_student)
 
@@ -7,6 +7,7 @@ for managing students, instructors, courses, registrations, and assignments.
 """
 import sys
 from PyQt5 import QtWidgets
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QApplication, QWidget, QTabWidget, QVBoxLayout
 
 from qt_forms.student_form import build_student_tab
@@ -15,6 +16,15 @@ from qt_forms.course_form import build_course_tab
 from qt_forms.registration_form import build_registration_tab
 from qt_forms.assignment_form import build_assignment_tab
 from qt_forms.records_form import build_records_tab
+from qt_forms.combo_helpers import ObjectListModel
+
+
+class DataBus(QObject):
+    """
+    Announces that the in-memory records changed, so every view that shows
+    them can connect its own refresh.
+    """
+    dataChanged = pyqtSignal()
 
 def main():
     """
@@ -38,6 +48,8 @@ def main():
     students = []
     instructors = []
     courses = []
+    # Records keyed by ID, kept in step with the lists for O(1) lookups
+    id_index = {"student_id": {}, "instructor_id": {}, "course_id": {}}
 
     tabs = QTabWidget(central_widget)
     main_layout.addWidget(tabs)
@@ -56,23 +68,41 @@ def main():
     tabs.addTab(assignment_tab, "Assign Instructor")
     tabs.addTab(records_tab, "All Records")
 
+    # Every view showing the records refreshes when this signals a change
+    bus = DataBus(root)
+
+    # Refresh requests arriving within 50 ms of each other share one refresh
+    refresh_timer = QTimer(root)
+    refresh_timer.setSingleShot(True)
+    refresh_timer.setInterval(50)
+    refresh_timer.timeout.connect(bus.dataChanged.emit)
+
+    def schedule_refresh():
+        """Schedules a dataChanged signal, unless one is already pending."""
+        if not refresh_timer.isActive():
+            refresh_timer.start()
+
     # Build records tab first as other tabs might need to refresh it
     rec_layout = QVBoxLayout(records_tab)
     tree, refresh_table, records_container = build_records_tab(
-        records_tab, students, instructors, courses, on_data_change=None
+        records_tab, students, instructors, courses,
+        on_data_change=schedule_refresh, id_index=id_index
     )
     rec_layout.addWidget(records_container)
 
+    # Both tabs list the same courses, so they share one model
+    course_model = ObjectListModel(courses, lambda course: course.display_course(), central_widget)
+
     # Build registration and assignment tabs
     reg_layout = QVBoxLayout(registration_tab)
     registration_frame = build_registration_tab(
-        registration_tab, students, courses, refresh_table
+        registration_tab, students, courses, refresh_table, course_model
     )
     reg_layout.addWidget(registration_frame)
 
     assign_layout = QVBoxLayout(assignment_tab)
     assignment_frame = build_assignment_tab(
-        assignment_tab, instructors, courses, refresh_table
+        assignment_tab, instructors, courses, refresh_table, course_model
     )
     assign_layout.addWidget(assignment_frame)
 
@@ -87,31 +117,27 @@ def main():
         if hasattr(assignment_frame, "clear_dropdowns"):
             assignment_frame.clear_dropdowns()
 
-    def refresh_all():
-        """Refreshes all data views, including the main records table and dropdowns."""
-        refresh_table()
-        refresh_dropdowns()
+    # The records table and the dropdowns each refresh when the data changes
+    bus.dataChanged.connect(refresh_table)
+    bus.dataChanged.connect(refresh_dropdowns)
 
-    if hasattr(tree, '_on_data_change'):
-        tree._on_data_change = refresh_dropdowns
-    
     if hasattr(registration_frame, "refresh_cb"):
-        registration_frame.refresh_cb = refresh_all
+        registration_frame.refresh_cb = schedule_refresh
     if hasattr(assignment_frame, "refresh_cb"):
-        assignment_frame.refresh_cb = refresh_all
+        assignment_frame.refresh_cb = schedule_refresh
 
     # Build remaining tabs
     stud_layout = QVBoxLayout(student_tab)
-    stud_layout.addWidget(build_student_tab(student_tab, students, refresh_all))
+    stud_layout.addWidget(build_student_tab(student_tab, students, schedule_refresh, id_index["student_id"]))
 
     instr_layout = QVBoxLayout(instructor_tab)
-    instr_layout.addWidget(build_instructor_tab(instructor_tab, instructors, refresh_all))
+    instr_layout.addWidget(build_instructor_tab(instructor_tab, instructors, schedule_refresh, id_index["instructor_id"]))
 
     course_layout = QVBoxLayout(course_tab)
-    course_layout.addWidget(build_course_tab(course_tab, courses, refresh_all))
+    course_layout.addWidget(build_course_tab(course_tab, courses, schedule_refresh, id_index["course_id"]))
 
     # Initial data load
-    refresh_all()
+    bus.dataChanged.emit()
 
     root.show()
     sys.exit(app.exec_())
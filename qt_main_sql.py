@@ -6,6 +6,7 @@ It sets up the main application window, initializes the database manager, and bu
 tabbed user interface for managing students, instructors, courses, registrations, and assignments.
 """
 import sys
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout
 )
@@ -16,6 +17,7 @@ from qt_forms_sql.course_form import build_course_tab
 from qt_forms_sql.registration_form import build_registration_tab
 from qt_forms_sql.assignment_form import build_assignment_tab
 from qt_forms_sql.records_form import build_records_tab
+from qt_forms.background import wait_for_background
 
 from database_manager import DatabaseManager
 
@@ -49,6 +51,7 @@ class MainWindow(QMainWindow):
         # Create tab widget
         tab_control = QTabWidget(central_widget)
         layout.addWidget(tab_control)
+        self.tab_control = tab_control
 
         # Create tabs
         student_tab = QWidget()
@@ -67,7 +70,7 @@ class MainWindow(QMainWindow):
         tab_control.addTab(records_tab, "Records")
 
         # Build each tab
-        def refresh_all():
+        def do_refresh():
             """
             Refreshes the data in all relevant tabs to ensure the UI is up-to-date.
             """
@@ -81,6 +84,19 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"Error in refresh_all: {str(e)}")
 
+        # Refresh requests arriving within 50 ms of each other share one refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(do_refresh)
+
+        def refresh_all():
+            """
+            Schedules a refresh of all relevant tabs, unless one is already pending.
+            """
+            if not self._refresh_timer.isActive():
+                self._refresh_timer.start()
+
         # Create each tab's content with layouts
         student_layout = QVBoxLayout(student_tab)
         student_layout.addWidget(build_student_tab(student_tab, self.db_manager, refresh_all))
@@ -105,7 +121,36 @@ class MainWindow(QMainWindow):
         self.records_frame = records_frame  # Store reference to records frame
 
         # Initial load of all data
-        refresh_all()
+        do_refresh()
+
+    def _clear_tabs(self, tab_control):
+        """
+        Removes every tab, last to first.
+
+        Removing the last tab leaves no later tabs to shift, so this avoids the
+        quadratic cost of clear() or removing tabs from the front.
+
+        :param tab_control: The tab widget to empty.
+        :type tab_control: QTabWidget
+        """
+        for i in range(tab_control.count() - 1, -1, -1):
+            tab_control.removeTab(i)
+
+    def closeEvent(self, event):
+        """
+        Removes the tabs and closes the database connection when the window is closed.
+
+        Pending refreshes are cancelled and background inserts and backups are
+        allowed to finish first, so none of them runs against a closed connection.
+
+        :param event: The close event.
+        :type event: QCloseEvent
+        """
+        self._refresh_timer.stop()
+        wait_for_background()
+        self._clear_tabs(self.tab_control)
+        self.db_manager.close()
+        super().closeEvent(event)
 
 def main():
     """
@@ -15,16 +15,30 @@ class Student(Person):
     :type email: str
     :param student_id: The unique identifier for the student.
     :type student_id: str
-    :param registered_courses: A list of course IDs the student is registered for, defaults to None.
-    :type registered_courses: list[str], optional
+    :param registered_courses: The IDs of the courses the student is registered for, defaults to None.
+        They are stored as a set.
+    :type registered_courses: iterable[str], optional
     """
+    __slots__ = ("_student_id", "registered_courses")
+
     def __init__(self, name: str, age: int, email: str, student_id: str, registered_courses = None):
         super().__init__(name, age, email)
         self.student_id = student_id
-        if registered_courses is None:
-            self.registered_courses = []
-        else:
-            self.registered_courses = registered_courses
+        self.registered_courses = set(registered_courses) if registered_courses is not None else set()
+
+    @property
+    def student_id(self):
+        """
+        The student's unique identifier. Setting it clears the cached display string.
+
+        :rtype: str
+        """
+        return self._student_id
+
+    @student_id.setter
+    def student_id(self, value):
+        self._student_id = value
+        self._display = None
 
     def register_course(self, course):
         """
@@ -35,8 +49,7 @@ class Student(Person):
         :param course: The course to register for.
         :type course: Course
         """
-        if course.course_id not in self.registered_courses:
-            self.registered_courses.append(course.course_id)
+        self.registered_courses.add(course.course_id)
 
     def to_dict(self):
         """
@@ -48,7 +61,7 @@ class Student(Person):
         data = super().to_dict()
         data.update({
             "student_id": self.student_id,
-            "registered_courses": self.registered_courses
+            "registered_courses": sorted(self.registered_courses)
         })
         return data
     
@@ -59,8 +72,8 @@ class Student(Person):
 
         :param data: A dictionary containing student data.
         :type data: dict
-        :return: A new Student object.
-        :rtype: Student
+        :return: A new Student object, or None if a field is missing or invalid.
+        :rtype: Student or None
         """
         try:
             if(name := data.get("name")) is None:
@@ -71,20 +84,21 @@ class Student(Person):
                 raise ValueError("Email is required")
             if(student_id := data.get("student_id")) is None:
                 raise ValueError("Student ID is required")
-            name = Person.validate_name(data.get("name"))
-            age = Person.validate_age(data.get("age", 1))
-            email = Person.validate_email(data.get("email", ""))
-            student_id = data["student_id"]
-            registered_courses = data.get("registered_courses", [])
-        except Exception:
-            pass
-        return cls(name, age, email, student_id, registered_courses)
+            # The constructor validates the age and email
+            return cls(Person.validate_name(name), age, email, student_id,
+                       data.get("registered_courses", []))
+        except ValueError:
+            return None
     
     def display_student(self):
         """
         Generates a human-readable string for the student object.
 
+        The string is built once and reused until the ID or name changes.
+
         :return: A formatted string with the student's ID and name.
         :rtype: str
         """
-        return f"{self.student_id} - {self.name}"
\ No newline at end of file
+        if self._display is None:
+            self._display = f"{self.student_id} - {self.name}"
+        return self._display
\ No newline at end of file
@@ -37,19 +37,37 @@ def build_assignment_tab(parent, instructors, courses, refresh_cb):
     frame.pack(padx=20, pady=20, fill="x")
 
     tk.Label(frame, text="Instructor:").grid(row=0, column=0, sticky="w", padx=5, pady=5)
-    instructor_box  = ttk.Combobox(frame, state="readonly", width=40, values=[i.display_instructor() for i in instructors])
+    # The objects behind each dropdown's entries, in entry order, and the values
+    # last handed to it, so unchanged lists are not resent to Tk
+    frame._instr_snapshot = list(instructors)
+    frame._course_snapshot = list(courses)
+    frame._last_instr_values = tuple(i.display_instructor() for i in frame._instr_snapshot)
+    frame._last_course_values = tuple(c.display_course() for c in frame._course_snapshot)
+
+    instructor_box  = ttk.Combobox(frame, state="readonly", width=40, values=frame._last_instr_values)
     instructor_box.grid(row=0, column=1, padx=5, pady=5)
     
     tk.Label(frame, text="Course:").grid(row=1, column=0, sticky="w", padx=5, pady=5)
-    course_box = ttk.Combobox(frame, state="readonly", width=40, values=[c.display_course() for c in courses])
+    course_box = ttk.Combobox(frame, state="readonly", width=40, values=frame._last_course_values)
     course_box.grid(row=1, column=1, padx=5, pady=5)
 
     def refresh_boxes():
         """
         Refreshes the values in the instructor and course dropdowns.
+
+        A dropdown is only updated when its list of values has changed.
         """
-        instructor_box["values"]  = [i.display_instructor() for i in instructors]
-        course_box["values"] = [c.display_course() for c in courses]
+        frame._instr_snapshot = list(instructors)
+        instr_values = tuple(i.display_instructor() for i in frame._instr_snapshot)
+        if instr_values != frame._last_instr_values:
+            instructor_box["values"] = instr_values
+            frame._last_instr_values = instr_values
+
+        frame._course_snapshot = list(courses)
+        course_values = tuple(c.display_course() for c in frame._course_snapshot)
+        if course_values != frame._last_course_values:
+            course_box["values"] = course_values
+            frame._last_course_values = course_values
         
         
     def assign_instructor():
@@ -63,8 +81,9 @@ def build_assignment_tab(parent, instructors, courses, refresh_cb):
             messagebox.showwarning("Select both", "Please select an instructor and a course.")
             return
         
-        selected_instructor = instructors[instructor_index]
-        selected_course = courses[course_index]
+        # Read from the snapshots the entries were built from, not the live lists
+        selected_instructor = frame._instr_snapshot[instructor_index]
+        selected_course = frame._course_snapshot[course_index]
 
         if selected_course.instructor and selected_course.instructor.instructor_id == selected_instructor.instructor_id:
             messagebox.showinfo("Already assigned", f"{selected_instructor.name} is already assigned to {selected_instructor.course_name}.")
@@ -7,7 +7,7 @@ from tkinter import messagebox
 from course import Course
 from validators import require, validate_unique_id
 
-def build_course_tab(parent, courses, refresh_cb):
+def build_course_tab(parent, courses, refresh_cb, courses_by_id=None):
     """
     Builds the course creation tab for the Tkinter UI.
 
@@ -17,10 +17,15 @@ def build_course_tab(parent, courses, refresh_cb):
     :type courses: list[Course]
     :param refresh_cb: A callback function to refresh the main application's data.
     :type refresh_cb: callable
+    :param courses_by_id: The courses in the list keyed by ID, shared with other tabs that
+        change it. Built from the list when not given, defaults to None.
+    :type courses_by_id: dict[str, Course], optional
     :return: The frame containing the course creation tab's UI.
     :rtype: tk.LabelFrame
     """
-    
+    if courses_by_id is None:
+        courses_by_id = {str(course.course_id): course for course in courses}
+
     frame = tk.LabelFrame(parent, text="Add Course", padx=10, pady=10)
     frame.pack(padx=20, pady=20, fill="x")
 
@@ -43,11 +48,12 @@ def build_course_tab(parent, courses, refresh_cb):
         if not (require(course_id, "Course ID") and require(course_name, "Course Name")):
             return
         
-        if not validate_unique_id(course_id, courses, "course_id"):
+        if not validate_unique_id(course_id, courses_by_id, "course_id"):
             return
 
         course = Course(course_id=course_id, course_name=course_name)
         courses.append(course)
+        courses_by_id[course_id] = course
         messagebox.showinfo("Success", "Course Added!")
         id_input.delete(0, tk.END)
         name_input.delete(0, tk.END)
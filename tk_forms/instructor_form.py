@@ -5,10 +5,10 @@ This module provides the UI for adding a new instructor in a Tkinter application
 import tkinter as tk
 from tkinter import messagebox
 from instructor import Instructor
-from validators import validate_name, validate_age, validate_email, require, validate_unique_id
+from validators import validate_person, require, validate_unique_id
 from person import Person
 
-def build_instructor_tab(parent, instructors, refresh_cb):
+def build_instructor_tab(parent, instructors, refresh_cb, instructors_by_id=None):
     """
     Builds the instructor creation tab for the Tkinter UI.
 
@@ -18,9 +18,15 @@ def build_instructor_tab(parent, instructors, refresh_cb):
     :type instructors: list[Instructor]
     :param refresh_cb: A callback function to refresh the main application's data.
     :type refresh_cb: callable
+    :param instructors_by_id: The instructors in the list keyed by ID, shared with other tabs
+        that change it. Built from the list when not given, defaults to None.
+    :type instructors_by_id: dict[str, Instructor], optional
     :return: The frame containing the instructor creation tab's UI.
     :rtype: tk.LabelFrame
     """
+    if instructors_by_id is None:
+        instructors_by_id = {str(instructor.instructor_id): instructor for instructor in instructors}
+
     frame = tk.LabelFrame(parent, text="Add Instructor", padx=10, pady=10)
     frame.pack(padx=20, pady=20, fill="x")
 
@@ -49,16 +55,17 @@ def build_instructor_tab(parent, instructors, refresh_cb):
         email = email_input.get().strip()
         iid   = id_input.get().strip()
 
-        # validate inpts
-        if not (validate_name(name) and validate_age(age) and validate_email(email) and require(iid, "Instructor ID")):
+        # validate inputs
+        if not (validate_person(name, age, email) and require(iid, "Instructor ID")):
             return
         
         # check unique ID
-        if not validate_unique_id(iid, instructors, "instructor_id"):
+        if not validate_unique_id(iid, instructors_by_id, "instructor_id"):
             return
 
         instructor = Instructor(name=name, age=age, email=email, instructor_id=iid)
         instructors.append(instructor)
+        instructors_by_id[iid] = instructor
         messagebox.showinfo("Success", "Instructor Added!")
         
         name_input.delete(0, tk.END)
@@ -120,16 +120,6 @@ def apply_search(tree, query_entry, scope_combo, students, instructors, courses)
             tree.insert("", "end", values=r)
         return
 
-    def record_matches(row):
-        record_type, record_id, name, email = row
-        
-        if (q in str(record_id).lower() or
-            q in (name or "").lower() or 
-            q in (email or "").lower()):
-            return True
-        
-        return False
-
     # Build filtered results
     rows = []
     if scope in ("All", "Students"):
@@ -139,8 +129,11 @@ def apply_search(tree, query_entry, scope_combo, students, instructors, courses)
     if scope in ("All", "Courses"):
         rows += [course_row(course) for course in courses]
 
+    # One lowercased string per row, so each row costs a single substring test;
+    # newlines keep the query from matching across two fields
     for row in rows:
-        if record_matches(row):
+        _, record_id, name, email = row
+        if q in f"{record_id}\n{name or ''}\n{email or ''}".lower():
             tree.insert("", "end", values=row)
 
 def reset_search(query_entry, scope_combo, refresh_fn):
@@ -187,19 +180,19 @@ def export_to_csv(tree):
         with open(filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             # Write headers
-            headers = [tree.heading(col)["text"] for col in tree["columns"]]
+            heading = tree.heading
+            headers = [heading(col, "text") for col in tree["columns"]]
             writer.writerow(headers)
             
-            # Write data
-            for item in items:
-                row = tree.item(item)["values"]
-                writer.writerow(row)
+            # Write data; asking for "values" alone skips building each item's full option dict
+            item_option = tree.item
+            writer.writerows(item_option(item, "values") for item in items)
                 
         messagebox.showinfo("Export Successful", f"Records have been exported to {filename}")
     except Exception as e:
         messagebox.showerror("Export Error", f"Failed to export records: {str(e)}")
 
-def open_person_edit_dialog(parent, person, person_type, students, instructors, courses, refresh_fn):
+def open_person_edit_dialog(parent, person, person_type, students, instructors, courses, refresh_fn, id_index):
     """
     Opens a dialog window to edit the details of a student or instructor.
 
@@ -217,6 +210,8 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
     :type courses: list[Course]
     :param refresh_fn: A callback function to refresh the main application's data.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     
     if not person:
@@ -263,15 +258,14 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
         email = email_var.get().strip()
         new_id = id_var.get().strip()
 
-        # Validation
-        if not all([validate_name(name), validate_age(age_str), 
-                   validate_email(email), require(new_id, f"{person_type.title()} ID")]):
+        # Validation stops at the first failure, so only one warning is shown
+        if not (validate_name(name) and validate_age(age_str) and
+                validate_email(email) and require(new_id, f"{person_type.title()} ID")):
             return
 
         # Check ID uniqueness
-        id_pool = students if person_type == "student" else instructors
         id_field = f"{person_type}_id"
-        if not validate_unique_id(new_id, id_pool, id_field, exclude=person):
+        if not validate_unique_id(new_id, id_index[id_field], id_field, exclude=person):
             return
 
         # Save changes
@@ -286,14 +280,17 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
             return
 
         setattr(person, id_field, new_id)
+        id_index[id_field].pop(str(old_id), None)
+        id_index[id_field][new_id] = person
 
         # Update course references if ID changed
         if old_id != new_id:
             if person_type == "student":
+                # Courses loaded from JSON hold their own copy of the student, so match by ID
                 for course in courses:
-                    for i, student in enumerate(course.enrolled_students):
-                        if student is person:
-                            course.enrolled_students[i] = person
+                    if old_id in course.enrolled_students:
+                        del course.enrolled_students[old_id]
+                        course.enrolled_students[new_id] = person
             else:  # instructor
                 for course in courses:
                     if course.instructor is person:
@@ -305,7 +302,7 @@ def open_person_edit_dialog(parent, person, person_type, students, instructors,
     ttk.Button(button_frame, text="Save", command=save_changes).pack(side="right", padx=5)
     ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side="right")
 
-def open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn):
+def open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn, id_index):
     """
     Opens a dialog window to edit the details of a course.
 
@@ -321,6 +318,8 @@ def open_course_edit_dialog(parent, course, students, instructors, courses, refr
     :type courses: list[Course]
     :param refresh_fn: A callback function to refresh the main application's data.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     
     if not course:
@@ -354,22 +353,24 @@ def open_course_edit_dialog(parent, course, students, instructors, courses, refr
         if not (require(new_id, "Course ID") and require(new_name, "Course Name")):
             return
 
-        if not validate_unique_id(new_id, courses, "course_id", exclude=course):
+        if not validate_unique_id(new_id, id_index["course_id"], "course_id", exclude=course):
             return
 
         course.course_id = new_id
+        id_index["course_id"].pop(str(old_id), None)
+        id_index["course_id"][new_id] = course
         course.course_name = new_name
 
         # Update references in student/instructor lists
         if old_id != new_id:
             for student in students:
-                for i, c in enumerate(student.registered_courses):
-                    if c.course_id == old_id:
-                        student.registered_courses[i] = new_id
+                if old_id in student.registered_courses:
+                    student.registered_courses.discard(old_id)
+                    student.registered_courses.add(new_id)
             for instructor in instructors:
-                for i, c in enumerate(instructor.assigned_courses):
-                    if c.course_id == old_id:
-                        instructor.assigned_courses[i] = new_id
+                if old_id in instructor.assigned_courses:
+                    instructor.assigned_courses.discard(old_id)
+                    instructor.assigned_courses.add(new_id)
 
         dialog.destroy()
         refresh_fn()
@@ -379,7 +380,7 @@ def open_course_edit_dialog(parent, course, students, instructors, courses, refr
     ttk.Button(button_frame, text="Save", command=save_course).pack(side="right", padx=5)
     ttk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side="right")
 
-def edit_selected(tree, parent, students, instructors, courses, refresh_fn):
+def edit_selected(tree, parent, students, instructors, courses, refresh_fn, id_index):
     """
     Opens an edit dialog for the currently selected item in the Treeview.
 
@@ -395,6 +396,8 @@ def edit_selected(tree, parent, students, instructors, courses, refresh_fn):
     :type courses: list[Course]
     :param refresh_fn: A callback function to refresh the main application's data.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     
     selection = tree.selection()
@@ -405,16 +408,16 @@ def edit_selected(tree, parent, students, instructors, courses, refresh_fn):
     record_type, record_id, *_ = tree.item(selection[0], "values")
 
     if record_type == "Student":
-        person = next((s for s in students if str(s.student_id) == str(record_id)), None)
-        open_person_edit_dialog(parent, person, "student", students, instructors, courses, refresh_fn)
+        person = id_index["student_id"].get(str(record_id))
+        open_person_edit_dialog(parent, person, "student", students, instructors, courses, refresh_fn, id_index)
     elif record_type == "Instructor":
-        person = next((i for i in instructors if str(i.instructor_id) == str(record_id)), None)
-        open_person_edit_dialog(parent, person, "instructor", students, instructors, courses, refresh_fn)
+        person = id_index["instructor_id"].get(str(record_id))
+        open_person_edit_dialog(parent, person, "instructor", students, instructors, courses, refresh_fn, id_index)
     elif record_type == "Course":
-        course = next((c for c in courses if str(c.course_id) == str(record_id)), None)
-        open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn)
+        course = id_index["course_id"].get(str(record_id))
+        open_course_edit_dialog(parent, course, students, instructors, courses, refresh_fn, id_index)
 
-def delete_selected(tree, students, instructors, courses, refresh_fn):
+def delete_selected(tree, students, instructors, courses, refresh_fn, id_index):
     """
     Deletes the currently selected item from the Treeview and the data lists.
 
@@ -428,6 +431,8 @@ def delete_selected(tree, students, instructors, courses, refresh_fn):
     :type courses: list[Course]
     :param refresh_fn: A callback function to refresh the main application's data.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     
     selection = tree.selection()
@@ -441,16 +446,15 @@ def delete_selected(tree, students, instructors, courses, refresh_fn):
         return
 
     if record_type == "Student":
-        student = next((s for s in students if str(s.student_id) == str(record_id)), None)
+        student = id_index["student_id"].pop(str(record_id), None)
         if student:
             # Remove from course enrollments
             for course in courses:
-                if student in course.enrolled_students:
-                    course.enrolled_students.remove(student)
+                course.enrolled_students.pop(student.student_id, None)
             students.remove(student)
 
     elif record_type == "Instructor":
-        instructor = next((i for i in instructors if str(i.instructor_id) == str(record_id)), None)
+        instructor = id_index["instructor_id"].pop(str(record_id), None)
         if instructor:
             # Remove instructor assignments
             for course in courses:
@@ -459,12 +463,11 @@ def delete_selected(tree, students, instructors, courses, refresh_fn):
             instructors.remove(instructor)
 
     elif record_type == "Course":
-        course = next((c for c in courses if str(c.course_id) == str(record_id)), None)
+        course = id_index["course_id"].pop(str(record_id), None)
         if course:
             # Remove from student/instructor lists
             for student in students:
-                if course.course_id in student.registered_courses:
-                    student.registered_courses.remove(course.course_id)
+                student.registered_courses.discard(course.course_id)
             for instructor in instructors:
                 if course.course_id in instructor.assigned_courses:
                     instructor.assigned_courses.remove(course.course_id)
@@ -492,7 +495,7 @@ def save_all(students, instructors, courses):
     except Exception as e:
         messagebox.showerror("Save Error", f"Failed to save data: {str(e)}")
 
-def load_all(students, instructors, courses, refresh_fn):
+def load_all(students, instructors, courses, refresh_fn, id_index):
     """
     Loads all student, instructor, and course data from their respective JSON files.
 
@@ -504,6 +507,8 @@ def load_all(students, instructors, courses, refresh_fn):
     :type courses: list[Course]
     :param refresh_fn: A callback function to refresh the main application's data.
     :type refresh_fn: callable
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field.
+    :type id_index: dict[str, dict[str, object]]
     """
     try:
         from student import Student
@@ -517,29 +522,30 @@ def load_all(students, instructors, courses, refresh_fn):
         
 
         # Create objects
-        loaded_students = [Student.from_dict(d) for d in student_data]
+        # Rows that fail validation come back as None and are skipped
+        loaded_students = [s for s in map(Student.from_dict, student_data) if s is not None]
         loaded_instructors = [Instructor.from_dict(d) for d in instructor_data]
         loaded_courses = [Course.from_dict(d) for d in course_data]
 
-        existing_students = {s.student_id for s in students}
-        existing_instructors = {i.instructor_id for i in instructors}
-        existing_courses = {c.course_id for c in courses}
+        existing_students = id_index["student_id"]
+        existing_instructors = id_index["instructor_id"]
+        existing_courses = id_index["course_id"]
 
         # Add new records (skip duplicates)
         for student in loaded_students:
-            if student.student_id not in existing_students:
+            if str(student.student_id) not in existing_students:
                 students.append(student)
-                existing_students.add(student.student_id)
+                existing_students[str(student.student_id)] = student
 
         for instructor in loaded_instructors:
-            if instructor.instructor_id not in existing_instructors:
+            if str(instructor.instructor_id) not in existing_instructors:
                 instructors.append(instructor)
-                existing_instructors.add(instructor.instructor_id)
+                existing_instructors[str(instructor.instructor_id)] = instructor
 
         for course in loaded_courses:
-            if course.course_id not in existing_courses:
+            if str(course.course_id) not in existing_courses:
                 courses.append(course)
-                existing_courses.add(course.course_id)
+                existing_courses[str(course.course_id)] = course
 
         refresh_fn()
         messagebox.showinfo("Success", "Data loaded successfully.")
@@ -549,7 +555,7 @@ def load_all(students, instructors, courses, refresh_fn):
     except Exception as e:
         messagebox.showerror("Load Error", f"Failed to load data: {str(e)}")
 
-def build_records_tab(parent, students, instructors, courses, on_data_change=None):
+def build_records_tab(parent, students, instructors, courses, on_data_change=None, id_index=None):
     """
     Builds the records management tab for the Tkinter UI.
 
@@ -563,9 +569,18 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
     :type courses: list[Course]
     :param on_data_change: An optional callback function to be called when data changes.
     :type on_data_change: callable, optional
+    :param id_index: The students, instructors and courses keyed by ID, grouped by ID field and
+        shared with the tabs that add records. Built from the lists when not given, defaults to None.
+    :type id_index: dict[str, dict[str, object]], optional
     :return: A tuple containing the Treeview widget and a refresh function.
     :rtype: tuple(ttk.Treeview, callable)
     """
+    if id_index is None:
+        id_index = {
+            "student_id": {str(student.student_id): student for student in students},
+            "instructor_id": {str(instructor.instructor_id): instructor for instructor in instructors},
+            "course_id": {str(course.course_id): course for course in courses},
+        }
     
     # Search controls
     search_frame = ttk.Frame(parent)
@@ -594,11 +609,11 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
     action_frame.pack(fill="x", padx=10, pady=(0, 8))
 
     ttk.Button(action_frame, text="Edit", 
-              command=lambda: edit_selected(tree, parent, students, instructors, courses, refresh_function)
+              command=lambda: edit_selected(tree, parent, students, instructors, courses, refresh_function, id_index)
               ).pack(side="left", padx=(0, 5))
 
     ttk.Button(action_frame, text="Delete", 
-              command=lambda: delete_selected(tree, students, instructors, courses, refresh_function)
+              command=lambda: delete_selected(tree, students, instructors, courses, refresh_function, id_index)
               ).pack(side="left", padx=(0, 5))
 
     ttk.Button(action_frame, text="Save All", 
@@ -606,7 +621,7 @@ def build_records_tab(parent, students, instructors, courses, on_data_change=Non
               ).pack(side="left", padx=(0, 5))
 
     ttk.Button(action_frame, text="Load All", 
-              command=lambda: load_all(students, instructors, courses, refresh_function)
+              command=lambda: load_all(students, instructors, courses, refresh_function, id_index)
               ).pack(side="left", padx=(0, 5))
 
     ttk.Button(action_frame, text="Export to CSV", 
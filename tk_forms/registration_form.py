@@ -70,7 +70,7 @@ def build_registration_tab(parent, students, courses, refresh_cb):
         selected_course = courses[course_index]
 
         # prevent duplicates
-        if any(registered_course.course_id == selected_course.course_id for registered_course in getattr(selected_student, "registered_courses", [])):
+        if selected_course.course_id in selected_student.registered_courses:
             messagebox.showinfo("Already registered", f"{selected_student.name} is already in {selected_course.course_id}.")
             return
 
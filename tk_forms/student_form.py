@@ -8,9 +8,9 @@ import tkinter as tk
 from tkinter import messagebox
 from student import Student
 
-from validators import validate_name, validate_age, require, validate_email, validate_unique_id
+from validators import validate_person, require, validate_unique_id
 
-def build_student_tab(parent, students, refresh_cb):
+def build_student_tab(parent, students, refresh_cb, students_by_id=None):
     """
     Builds the 'Add Student' tab for the Tkinter application.
 
@@ -25,9 +25,15 @@ def build_student_tab(parent, students, refresh_cb):
     :param refresh_cb: A callback function to be called after a student is successfully added,
                        to refresh the display of student records.
     :type refresh_cb: function
+    :param students_by_id: The students in the list keyed by ID, shared with other tabs that
+        change it. Built from the list when not given, defaults to None.
+    :type students_by_id: dict[str, Student], optional
     :return: The LabelFrame widget containing the student form.
     :rtype: tk.LabelFrame
     """
+    if students_by_id is None:
+        students_by_id = {str(student.student_id): student for student in students}
+
     frame = tk.LabelFrame(parent, text="Add Student", padx=10, pady=10)
     frame.pack(padx=20, pady=20, fill="x")
 
@@ -61,15 +67,16 @@ def build_student_tab(parent, students, refresh_cb):
         sid   = id_input.get().strip()
 
         # validate inputs
-        if not (validate_name(name) and validate_age(age) and validate_email(email) and require(sid, "Student ID")):
+        if not (validate_person(name, age, email) and require(sid, "Student ID")):
             return
 
         # check unique ID
-        if not validate_unique_id(sid, students, "student_id"):
+        if not validate_unique_id(sid, students_by_id, "student_id"):
             return
 
         student = Student(name=name, age=age, email=email, student_id=sid)
         students.append(student)
+        students_by_id[sid] = student
         messagebox.showinfo("Success", "Student Added!")
 
 
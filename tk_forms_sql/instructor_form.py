@@ -56,9 +56,9 @@ def build_instructor_tab(parent, db_manager, refresh_cb):
         email = email_input.get().strip()
         instructor_id = id_input.get().strip()
 
-        # validate inputs
-        if not (validate_name(name) and validate_age(age) and require(age, "age") and 
-                validate_email(email) and require(instructor_id, "Instructor ID") and require(name, "Name") and require(email, "Email") and require(age, "Age")):
+        # Each validator also rejects an empty value, so only the ID needs require
+        if not (validate_name(name) and validate_age(age) and
+                validate_email(email) and require(instructor_id, "Instructor ID")):
             return
         
         try:
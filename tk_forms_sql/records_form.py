@@ -50,16 +50,8 @@ def fill_tree(tree, db_manager):
     :param db_manager: The manager for database operations.
     :type db_manager: DatabaseManager
     """
-    students = db_manager.get_all_students()
-    instructors = db_manager.get_all_instructors()
-    courses = db_manager.get_all_courses()
-    
-    for s in students:
-        tree.insert("", "end", values=student_row(s))
-    for i in instructors:
-        tree.insert("", "end", values=instructor_row(i))
-    for c in courses:
-        tree.insert("", "end", values=course_row(c))
+    for row in db_manager.get_all_records():
+        tree.insert("", "end", values=row)
 
 def refresh_tree(tree, db_manager):
     """
@@ -112,18 +104,17 @@ def apply_search(tree, query_entry, scope_combo, db_manager):
             tree.insert("", "end", values=course_row(c))
         return
 
-    def record_matches(row):
-        record_type, record_id, name, email = row
-        return any(q in str(val).lower() for val in (record_id, name, email))
-
     # Build filtered results
     rows = []
     rows.extend(student_row(s) for s in students)
     rows.extend(instructor_row(i) for i in instructors)
     rows.extend(course_row(c) for c in courses)
 
+    # One lowercased string per row, so each row costs a single substring test;
+    # newlines keep the query from matching across two fields
     for row in rows:
-        if record_matches(row):
+        _, record_id, name, email = row
+        if q in f"{record_id}\n{name}\n{email}".lower():
             tree.insert("", "end", values=row)
 
 def reset_search(query_entry, scope_combo, refresh_fn):
@@ -169,13 +160,13 @@ def export_to_csv(tree):
         with open(filename, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             # Write headers
-            headers = [tree.heading(col)["text"] for col in tree["columns"]]
+            heading = tree.heading
+            headers = [heading(col, "text") for col in tree["columns"]]
             writer.writerow(headers)
             
-            # Write data
-            for item in items:
-                row = tree.item(item)["values"]
-                writer.writerow(row)
+            # Write data; asking for "values" alone skips building each item's full option dict
+            item_option = tree.item
+            writer.writerows(item_option(item, "values") for item in items)
                 
         messagebox.showinfo("Export Successful", f"Records have been exported to {filename}")
     except Exception as e:
@@ -299,8 +290,13 @@ def build_records_tab(parent, db_manager):
                            command=lambda: apply_search(tree, query_entry, scope_combo, db_manager))
     reset_btn = ttk.Button(button_frame, text="Clear", 
                           command=lambda: reset_search(query_entry, scope_combo, refresh_records))
+    def reload_records():
+        """Re-reads the records from the database, including changes made by other processes."""
+        db_manager.invalidate_all()
+        refresh_records()
+
     refresh_btn = ttk.Button(button_frame, text="Refresh", 
-                          command=lambda: refresh_records())
+                          command=reload_records)
 
     search_btn.pack(side="left", padx=2)
     reset_btn.pack(side="left", padx=2)
@@ -32,6 +32,8 @@ def main():
     students = []
     instructors = []
     courses = []
+    # Records keyed by ID, kept in step with the lists for O(1) lookups
+    id_index = {"student_id": {}, "instructor_id": {}, "course_id": {}}
 
     # Create tab container
     tabs = ttk.Notebook(root)
@@ -54,7 +56,7 @@ def main():
 
     # Build the records tab first to get the refresh_table callback
     tree, refresh_table = build_records_tab(
-        records_tab, students, instructors, courses
+        records_tab, students, instructors, courses, id_index=id_index
     )
 
     # Build registration and assignment tabs
@@ -86,9 +88,9 @@ def main():
         tree.on_data_change = refresh_dropdowns
 
     # Build the remaining tabs, passing the refresh_all callback
-    build_student_tab(student_tab, students, refresh_all)
-    build_instructor_tab(instructor_tab, instructors, refresh_all)
-    build_course_tab(course_tab, courses, refresh_all)
+    build_student_tab(student_tab, students, refresh_all, id_index["student_id"])
+    build_instructor_tab(instructor_tab, instructors, refresh_all, id_index["instructor_id"])
+    build_course_tab(course_tab, courses, refresh_all, id_index["course_id"])
 
     # Set refresh callbacks for registration and assignment forms
     if hasattr(registration_frame, "refresh_cb"):
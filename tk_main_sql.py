@@ -86,9 +86,13 @@ class MainWindow:
 
     def run(self):
         """
-        Starts the Tkinter main event loop.
+        Starts the Tkinter main event loop and closes the database connection
+        once the window is closed.
         """
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.db_manager.close()
 
 def main():
     """
@@ -1,6 +1,7 @@
 """
 This module provides validation functions for the application's forms.
 """
+from operator import attrgetter
 from tkinter import messagebox
 from person import Person
 
@@ -52,6 +53,32 @@ def validate_email(email):
         messagebox.showwarning("Invalid Input", str(e))
         return False
 
+def validate_person(name, age_str, email):
+    """
+    Validates a name, age and email together and shows one warning listing
+    every problem found.
+
+    :param name: The name to validate.
+    :type name: str
+    :param age_str: The age string to validate.
+    :type age_str: str
+    :param email: The email to validate.
+    :type email: str
+    :return: True if all three are valid, False otherwise.
+    :rtype: bool
+    """
+    errors = []
+    for check, value in ((Person.validate_name, name), (Person.validate_age, age_str),
+                         (Person.validate_email, email)):
+        try:
+            check(value)
+        except ValueError as e:
+            errors.append(str(e))
+    if errors:
+        messagebox.showwarning("Invalid Input", "\n".join(errors))
+        return False
+    return True
+
 def require(value, label):
     """
     Checks that a value is not empty and shows a warning if it is.
@@ -72,10 +99,13 @@ def validate_unique_id(new_id, items, attr_name, exclude=None):
     """
     Validates that a given ID is unique among a list of objects.
 
+    When a dict mapping the IDs in use to their objects is passed instead of a
+    list, the check is a single hash lookup rather than a scan.
+
     :param new_id: The new ID to validate.
     :type new_id: str
-    :param items: A list of objects to check for uniqueness against.
-    :type items: list
+    :param items: A list of objects, or a dict of objects keyed by ID, to check against.
+    :type items: list or dict[str, any]
     :param attr_name: The name of the ID attribute on the objects.
     :type attr_name: str
     :param exclude: An optional object to exclude from the uniqueness check, defaults to None.
@@ -84,8 +114,13 @@ def validate_unique_id(new_id, items, attr_name, exclude=None):
     :rtype: bool
     """
     new_id = str(new_id).strip()
-    for obj in items:
-        if str(getattr(obj, attr_name)) == new_id and obj is not exclude:
-            messagebox.showwarning("Invalid Input", f"{attr_name.replace('_', ' ').title()} must be unique.")
-            return False
+    if isinstance(items, dict):
+        owner = items.get(new_id)
+        taken = owner is not None and owner is not exclude
+    else:
+        get_id = attrgetter(attr_name)
+        taken = any(str(get_id(obj)) == new_id and obj is not exclude for obj in items)
+    if taken:
+        messagebox.showwarning("Invalid Input", f"{attr_name.replace('_', ' ').title()} must be unique.")
+        return False
     return True